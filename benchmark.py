@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import socket
+import string
+import threading
+import time
+
+from client1_sender import METHOD_MAP, create_packet, get_control_info
+from client2_receiver import Client2Receiver
+from console import add_logging_arguments, configure_logging, flush_logs
+from server import ERROR_METHODS, CorruptionEngine, Server
+
+def make_payload(size, seed=0):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + ' '
+    return ''.join(rng.choice(alphabet) for _ in range(size))
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+class LatencyTracker:
+    def __init__(self, expected):
+        self.expected = expected
+        self.lock = threading.Lock()
+        self.sent = {}
+        self.latencies = []
+        self.valid = 0
+        self.corrupted = 0
+        self.done = threading.Event()
+    
+    def mark_sent(self, stream_id, seq):
+        with self.lock:
+            self.sent[(stream_id, seq)] = time.perf_counter()
+    
+    def on_result(self, result):
+        now = time.perf_counter()
+        with self.lock:
+            sent_at = self.sent.pop((result['stream_id'], result['seq']), None)
+            if sent_at is None:
+                return
+            self.latencies.append(now - sent_at)
+            if result['is_valid']:
+                self.valid += 1
+            else:
+                self.corrupted += 1
+            if len(self.latencies) >= self.expected:
+                self.done.set()
+
+def drain_replies(sock, window):
+    buffer = b''
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        for _ in lines:
+            window.release()
+
+def run_sender(port, stream_id, count, payload, method, window_size, tracker):
+    window = threading.Semaphore(window_size)
+    with socket.create_connection(('localhost', port)) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        reply_thread = threading.Thread(target=drain_replies, args=(sock, window), daemon=True)
+        reply_thread.start()
+        
+        for seq in range(count):
+            window.acquire()
+            packet = create_packet(payload, method, get_control_info(payload, method),
+                                   stream_id=stream_id, seq=seq)
+            tracker.mark_sent(stream_id, seq)
+            sock.sendall(packet)
+        
+        sock.shutdown(socket.SHUT_WR)
+        reply_thread.join()
+
+def run_benchmark(packets=1000, concurrency=4, payload_size=64, method='CRC16', error_method='6',
+                  server_mode='thread', window=1, pool_size=4, timeout=60.0, ber=None, seed=None,
+                  verify_workers=None, verify_batch=32, zero_copy=False,
+                  cache_size=0):
+    total = packets * concurrency
+    tracker = LatencyTracker(total)
+    payload = make_payload(payload_size)
+    corruption = CorruptionEngine('ber', ber=ber, seed=seed) if ber else CorruptionEngine(seed=seed)
+    
+    receiver = Client2Receiver(port=0, interactive=False, on_result=tracker.on_result,
+                               verify_workers=verify_workers, verify_batch=verify_batch, cache_size=cache_size)
+    server = None
+    
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        threading.Thread(target=receiver.start, daemon=True).start()
+        receiver.ready.wait(5)
+        
+        server = Server(port=0, client2_port=receiver.port, mode=server_mode,
+                        backlog=max(5, concurrency), pool_size=pool_size, interactive=False,
+                        corruption=corruption, zero_copy=zero_copy)
+        server.error_method = error_method
+        threading.Thread(target=server.start, daemon=True).start()
+        server.ready.wait(5)
+        
+        start = time.perf_counter()
+        senders = [
+            threading.Thread(target=run_sender,
+                             args=(server.port, stream_id + 1, packets, payload, method, window, tracker))
+            for stream_id in range(concurrency)
+        ]
+        for sender in senders:
+            sender.start()
+        for sender in senders:
+            sender.join()
+        tracker.done.wait(timeout)
+        elapsed = time.perf_counter() - start
+        
+        server.running = False
+        receiver.running = False
+        flush_logs()
+    
+    latencies = sorted(tracker.latencies)
+    delivered = len(latencies)
+    payload_bytes = delivered * len(payload.encode('utf-8'))
+    
+    def ms(value):
+        return None if value is None else round(value * 1000, 3)
+    
+    return {
+        'config': {
+            'packets_per_sender': packets,
+            'concurrency': concurrency,
+            'payload_size': payload_size,
+            'method': method,
+            'error_method': corruption.describe() if ber else ERROR_METHODS[error_method][0],
+            'server_mode': server_mode,
+            'zero_copy': zero_copy,
+            'window': window,
+            'pool_size': pool_size,
+            'verify_workers': receiver.verify_workers,
+            'cache_size': cache_size,
+        },
+        'cache_hits': receiver.cache_lookups.get('hit'),
+        'cache_misses': receiver.cache_lookups.get('miss'),
+        'sent': total,
+        'delivered': delivered,
+        'valid': tracker.valid,
+        'corrupted': tracker.corrupted,
+        'elapsed_s': round(elapsed, 4),
+        'packets_per_s': round(delivered / elapsed, 1) if elapsed else None,
+        'mb_per_s': round(payload_bytes / elapsed / 1e6, 3) if elapsed else None,
+        'latency_ms': {
+            'mean': ms(sum(latencies) / delivered) if delivered else None,
+            'p50': ms(percentile(latencies, 50)),
+            'p95': ms(percentile(latencies, 95)),
+            'p99': ms(percentile(latencies, 99)),
+            'max': ms(latencies[-1] if latencies else None),
+        },
+    }
+
+def display_benchmark(result):
+    config = result['config']
+    latency = result['latency_ms']
+    print("\n" + "="*60)
+    print("       UÇTAN UCA PERFORMANS ÖLÇÜMÜ")
+    print("="*60)
+    print(f"  Yöntem / Hata    : {config['method']} / {config['error_method']}")
+    print(f"  Server Modu      : {config['server_mode']}{' (sıfır kopya)' if config['zero_copy'] else ''}")
+    if config['verify_workers']:
+        print(f"  Doğrulama Havuzu : {config['verify_workers']} süreç")
+    print(f"  Eşzamanlılık     : {config['concurrency']} gönderici × {config['packets_per_sender']} paket "
+          f"(pencere {config['window']})")
+    print(f"  Veri Boyutu      : {config['payload_size']} bayt")
+    if config['cache_size']:
+        print(f"  Önbellek         : {config['cache_size']} girdi, "
+              f"{result['cache_hits']} isabet / {result['cache_misses']} ıska")
+    print("-"*60)
+    print(f"  Gönderilen/Ulaşan: {result['sent']} / {result['delivered']}")
+    print(f"  Doğru / Bozuk    : {result['valid']} / {result['corrupted']}")
+    print(f"  Süre             : {result['elapsed_s']} s")
+    print(f"  Paket Hızı       : {result['packets_per_s']} paket/s")
+    print(f"  Veri Hızı        : {result['mb_per_s']} MB/s")
+    print(f"  Gecikme (ms)     : p50 {latency['p50']} | p95 {latency['p95']} | "
+          f"p99 {latency['p99']} | maks {latency['max']}")
+    print("="*60)
+
+def main():
+    parser = argparse.ArgumentParser(description="Gönderici → server → alıcı hattı için uçtan uca performans ölçümü")
+    parser.add_argument('--packets', type=int, default=1000, help="Gönderici başına paket sayısı (varsayılan: 1000)")
+    parser.add_argument('--concurrency', type=int, default=4, help="Eşzamanlı gönderici sayısı (varsayılan: 4)")
+    parser.add_argument('--payload-size', type=int, default=64, help="Paket veri boyutu, bayt (varsayılan: 64)")
+    parser.add_argument('--method', default='CRC16', help="Hata tespit yöntemi (varsayılan: CRC16)")
+    parser.add_argument('--error-method', choices=sorted(ERROR_METHODS), default='6',
+                        help="Server hata enjekte yöntemi (varsayılan: 6, bozma yok)")
+    parser.add_argument('--server-mode', choices=['thread', 'async', 'pipeline'], default='thread',
+                        help="Server bağlantı modeli (varsayılan: thread)")
+    parser.add_argument('--zero-copy', action='store_true', help="Server'da sıfır kopya aktarım yolunu kullan")
+    parser.add_argument('--window', type=int, default=1,
+                        help="Bağlantı başına yanıt beklemeden gönderilebilecek paket sayısı (varsayılan: 1)")
+    parser.add_argument('--pool-size', type=int, default=4, help="Server → Client 2 bağlantı havuzu (varsayılan: 4)")
+    parser.add_argument('--ber', type=float,
+                        help="Tek hata yerine bu bit hata oranıyla bozma (örn. 1e-5)")
+    parser.add_argument('--seed', type=int, help="Bozma RNG tohumu (varsayılan: rastgele)")
+    parser.add_argument('--verify-pool', type=int, nargs='?', const=0, metavar='N',
+                        help="Alıcıda doğrulamayı N süreçlik havuzda yap (N verilmezse çekirdek sayısı)")
+    parser.add_argument('--verify-batch', type=int, default=32, metavar='N',
+                        help="Havuza tek seferde gönderilen en fazla paket sayısı (varsayılan: 32)")
+    parser.add_argument('--cache-size', type=int, default=0, metavar='N',
+                        help="Alıcıda N girdilik kontrol değeri önbelleği (varsayılan: 0, kapalı)")
+    parser.add_argument('--timeout', type=float, default=60.0, help="Teslim için azami bekleme, saniye (varsayılan: 60)")
+    parser.add_argument('--output', metavar='DOSYA', help="Sonuçların yazılacağı JSON dosyası")
+    add_logging_arguments(parser)
+    args = parser.parse_args()
+    
+    configure_logging(args.verbosity, args.sample)
+    method = METHOD_MAP.get(args.method.upper(), args.method.upper())
+    result = run_benchmark(
+        packets=args.packets, concurrency=args.concurrency, payload_size=args.payload_size,
+        method=method, error_method=args.error_method, server_mode=args.server_mode,
+        window=args.window, pool_size=args.pool_size, timeout=args.timeout,
+        ber=args.ber, seed=args.seed, verify_workers=args.verify_pool, verify_batch=args.verify_batch,
+        zero_copy=args.zero_copy, cache_size=args.cache_size
+    )
+    result['timestamp'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    
+    display_benchmark(result)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+        print(f"\nSonuçlar yazıldı: {args.output}")
+
+if __name__ == "__main__":
+    main()
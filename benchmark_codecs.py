@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+
+import argparse
+import gc
+import importlib
+import json
+import random
+import time
+import tracemalloc
+
+from client1_sender import get_control_info
+
+def reference_text_to_binary(text):
+    return ''.join(format(ord(c), '08b') for c in text)
+
+def reference_parity(text):
+    binary = reference_text_to_binary(text)
+    ones_count = binary.count('1')
+    parity_bit = '1' if ones_count % 2 != 0 else '0'
+    return parity_bit
+
+def reference_2d_parity(text):
+    binary = reference_text_to_binary(text)
+    
+    cols = 8
+    rows = (len(binary) + cols - 1) // cols
+    
+    padded_binary = binary.ljust(rows * cols, '0')
+    
+    matrix = []
+    for i in range(rows):
+        row = list(padded_binary[i*cols:(i+1)*cols])
+        matrix.append(row)
+    
+    row_parities = []
+    for row in matrix:
+        ones = sum(int(b) for b in row)
+        row_parities.append('1' if ones % 2 != 0 else '0')
+    
+    col_parities = []
+    for j in range(cols):
+        ones = sum(int(matrix[i][j]) for i in range(rows))
+        col_parities.append('1' if ones % 2 != 0 else '0')
+    
+    control_info = ''.join(row_parities) + ''.join(col_parities)
+    return format(int(control_info, 2), 'X').zfill(4) if control_info else '0'
+
+def reference_crc16(text):
+    data = text.encode('utf-8')
+    crc = 0xFFFF
+    polynomial = 0x1021
+    
+    for byte in data:
+        crc ^= (byte << 8)
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = (crc << 1) ^ polynomial
+            else:
+                crc <<= 1
+            crc &= 0xFFFF
+    
+    return format(crc, '04X')
+
+def reference_hamming(text):
+    binary = reference_text_to_binary(text)
+    
+    blocks = [binary[i:i+4] for i in range(0, len(binary), 4)]
+    
+    hamming_bits = []
+    for block in blocks:
+        if len(block) < 4:
+            block = block.ljust(4, '0')
+        
+        d = [int(b) for b in block]
+        
+        p1 = d[0] ^ d[1] ^ d[3]
+        p2 = d[0] ^ d[2] ^ d[3]
+        p4 = d[1] ^ d[2] ^ d[3]
+        
+        hamming_bits.extend([p1, p2, p4])
+    
+    hamming_str = ''.join(str(b) for b in hamming_bits)
+    if len(hamming_str) % 4 != 0:
+        hamming_str = hamming_str.ljust((len(hamming_str) // 4 + 1) * 4, '0')
+    
+    result = ''
+    for i in range(0, len(hamming_str), 4):
+        result += format(int(hamming_str[i:i+4], 2), 'X')
+    
+    return result if result else '0'
+
+def reference_checksum(text):
+    data = text.encode('utf-8')
+    
+    if len(data) % 2 != 0:
+        data += b'\x00'
+    
+    checksum = 0
+    for i in range(0, len(data), 2):
+        word = (data[i] << 8) + data[i+1]
+        checksum += word
+        while checksum > 0xFFFF:
+            checksum = (checksum & 0xFFFF) + (checksum >> 16)
+    
+    checksum = ~checksum & 0xFFFF
+    
+    return format(checksum, '04X')
+
+def reference_reflected_crc32(text, polynomial):
+    crc = 0xFFFFFFFF
+    
+    for byte in text.encode('utf-8'):
+        crc ^= byte
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ polynomial
+            else:
+                crc >>= 1
+    
+    return format(crc ^ 0xFFFFFFFF, '08X')
+
+def reference_crc32(text):
+    return reference_reflected_crc32(text, 0xEDB88320)
+
+def reference_crc32c(text):
+    return reference_reflected_crc32(text, 0x82F63B78)
+
+def reference_adler32(text):
+    a, b = 1, 0
+    
+    for byte in text.encode('utf-8'):
+        a = (a + byte) % 65521
+        b = (b + a) % 65521
+    
+    return format((b << 16) | a, '08X')
+
+def reference_fletcher16(text):
+    sum1, sum2 = 0, 0
+    
+    for byte in text.encode('utf-8'):
+        sum1 = (sum1 + byte) % 255
+        sum2 = (sum2 + sum1) % 255
+    
+    return format((sum2 << 8) | sum1, '04X')
+
+REFERENCE_CODECS = {
+    'PARITY': reference_parity,
+    '2DPARITY': reference_2d_parity,
+    'CRC16': reference_crc16,
+    'HAMMING': reference_hamming,
+    'CHECKSUM': reference_checksum,
+    'CRC32': reference_crc32,
+    'CRC32C': reference_crc32c,
+    'ADLER32': reference_adler32,
+    'FLETCHER16': reference_fletcher16,
+}
+
+METHODS = list(REFERENCE_CODECS)
+SIZES = [16 * 4 ** i for i in range(11)]
+MULTIBYTE_ALPHABET = 'çğıöşüÇĞİÖŞÜ' + 'abcdefghijklmnopqrstuvwxyz '
+
+def reference_control_info(text, method):
+    return REFERENCE_CODECS[method.upper()](text)
+
+def load_engine(spec):
+    module_name, _, function_name = spec.partition(':')
+    return getattr(importlib.import_module(module_name), function_name or 'get_control_info')
+
+def make_payload(size, charset, seed=0):
+    rng = random.Random(seed)
+    if charset == 'ascii':
+        return ''.join(chr(rng.randint(32, 126)) for _ in range(size))
+    
+    chars = []
+    length = 0
+    while True:
+        c = rng.choice(MULTIBYTE_ALPHABET)
+        width = len(c.encode('utf-8'))
+        if length + width > size:
+            break
+        chars.append(c)
+        length += width
+    return ''.join(chars).ljust(size - length + len(chars), ' ')
+
+def measure(func, text, method, min_time):
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = func(text, method)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    
+    runs = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while runs == 0 or elapsed < min_time:
+        func(text, method)
+        runs += 1
+        elapsed = time.perf_counter() - start
+    
+    return result, elapsed / runs, peak
+
+def run_codec_benchmark(engines, methods=METHODS, sizes=SIZES, charsets=('ascii', 'utf8'),
+                        reference_max_size=256 * 1024, min_time=0.2, progress=None):
+    rows = []
+    for charset in charsets:
+        for size in sizes:
+            text = make_payload(size, charset)
+            nbytes = len(text.encode('utf-8'))
+            for method in methods:
+                # Referans çalışmadığında (boyut sınırı, --no-reference) satırlar
+                # karşılaştırılmamış olarak işaretlenir: matches None.
+                expected = None
+                for name, func in engines.items():
+                    is_reference = func is reference_control_info
+                    if is_reference and nbytes > reference_max_size:
+                        continue
+                    
+                    result, seconds, peak = measure(func, text, method, min_time)
+                    if is_reference:
+                        expected = result
+                    row = {
+                        'engine': name,
+                        'method': method,
+                        'charset': charset,
+                        'bytes': nbytes,
+                        'ns_per_byte': round(seconds * 1e9 / max(nbytes, 1), 3),
+                        'seconds': seconds,
+                        'peak_alloc_bytes': peak,
+                        'alloc_per_byte': round(peak / max(nbytes, 1), 3),
+                        'matches': None if expected is None else result == expected,
+                    }
+                    rows.append(row)
+                    if progress:
+                        progress(row)
+    return rows
+
+def display_row(row):
+    status = {True: "✓", False: "✗ FARKLI", None: "- kontrol yok"}[row['matches']]
+    print(f"  {row['charset']:<5} {row['bytes']:>10} {row['method']:<10} {row['engine']:<10} "
+          f"{row['ns_per_byte']:>12.2f} {row['peak_alloc_bytes']:>12} {row['alloc_per_byte']:>8.2f}  {status}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Hata tespit yöntemleri için mikro performans ölçümü")
+    parser.add_argument('--methods', default=','.join(METHODS),
+                        help="Virgülle ayrılmış yöntemler (varsayılan: hepsi)")
+    parser.add_argument('--min-size', type=int, default=SIZES[0], help="En küçük veri boyutu, bayt (varsayılan: 16)")
+    parser.add_argument('--max-size', type=int, default=SIZES[-1],
+                        help="En büyük veri boyutu, bayt (varsayılan: 16 MB)")
+    parser.add_argument('--charsets', default='ascii,utf8', help="ascii, utf8 veya ikisi (varsayılan: ikisi)")
+    parser.add_argument('--engine', action='append', default=[], metavar='AD=MODÜL:FONKSİYON',
+                        help="Karşılaştırılacak ek motor, ör. hizli=my_codecs:get_control_info")
+    parser.add_argument('--no-reference', action='store_true', help="Orijinal skaler uygulamayı çalıştırma")
+    parser.add_argument('--reference-max-size', type=int, default=256 * 1024,
+                        help="Skaler referansın çalıştırılacağı en büyük boyut (varsayılan: 256 KB)")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="Her ölçüm için en az süre, saniye (varsayılan: 0.2)")
+    parser.add_argument('--output', metavar='DOSYA', help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+    
+    engines = {}
+    if not args.no_reference:
+        engines['reference'] = reference_control_info
+    engines['current'] = get_control_info
+    for spec in args.engine:
+        name, _, target = spec.partition('=')
+        engines[name] = load_engine(target)
+    
+    methods = [m.strip().upper() for m in args.methods.split(',') if m.strip()]
+    sizes = [s for s in SIZES if args.min_size <= s <= args.max_size]
+    charsets = [c.strip() for c in args.charsets.split(',') if c.strip()]
+    
+    print("\n" + "="*84)
+    print("       KODLAYICI MİKRO PERFORMANS ÖLÇÜMÜ")
+    print("="*84)
+    print(f"  {'küme':<5} {'bayt':>10} {'yöntem':<10} {'motor':<10} {'ns/bayt':>12} {'tepe bellek':>12} {'bellek/B':>8}")
+    print("-"*84)
+    rows = run_codec_benchmark(engines, methods, sizes, charsets, args.reference_max_size,
+                               args.min_time, progress=display_row)
+    print("="*84)
+    
+    mismatches = [row for row in rows if row['matches'] is False]
+    unchecked = [row for row in rows if row['matches'] is None]
+    if mismatches:
+        print(f"✗ {len(mismatches)} ölçümde çıktı referansla eşleşmedi!")
+    elif unchecked:
+        print(f"✓ Referansla karşılaştırılan {len(rows) - len(unchecked)} ölçüm eşleşti; "
+              f"{len(unchecked)} ölçüm referans çalışmadığı için kontrol edilmedi.")
+    else:
+        print("✓ Tüm motorların çıktıları eşleşti.")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': rows}, f, indent=2)
+        print(f"\nSonuçlar yazıldı: {args.output}")
+
+if __name__ == "__main__":
+    main()
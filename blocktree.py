@@ -0,0 +1,94 @@
+import binascii
+
+# Blok CRC ağacı: yük sabit boyutlu bloklara bölünür, her bloğun CRC-16'sı bir
+# yaprak olur ve üst düğümler çocuklarının CRC'lerinin CRC'sidir (Merkle
+# benzeri). Kontrol değeri: blok boyu (8 hex), blok sayısı (8 hex), ardından
+# kökten yapraklara seviye sırasıyla düğümler (her biri 4 hex).
+BLOCK_SIZE = 512
+HEADER_DIGITS = 16
+
+def crc16(data):
+    return binascii.crc_hqx(data, 0xFFFF)
+
+def block_count(length, block_size):
+    return max(1, -(-length // block_size))
+
+def level_sizes(count):
+    sizes = [count]
+    while sizes[0] > 1:
+        sizes.insert(0, (sizes[0] + 1) // 2)
+    return sizes
+
+def build_levels(data, block_size, count):
+    # levels[0] kök, levels[-1] yapraklar.
+    view = memoryview(data)
+    level = [crc16(view[i * block_size:(i + 1) * block_size]) for i in range(count)]
+    levels = [level]
+    while len(level) > 1:
+        level = [crc16(b''.join(value.to_bytes(2, 'big') for value in level[i:i + 2]))
+                 for i in range(0, len(level), 2)]
+        levels.insert(0, level)
+    return levels
+
+def encode(data, block_size=BLOCK_SIZE):
+    count = block_count(len(data), block_size)
+    levels = build_levels(data, block_size, count)
+    nodes = ''.join(format(value, '04X') for level in levels for value in level)
+    return f"{block_size:08X}{count:08X}{nodes}"
+
+def decode(control):
+    try:
+        block_size = int(control[:8], 16)
+        count = int(control[8:HEADER_DIGITS], 16)
+    except ValueError:
+        raise ValueError("Geçersiz blok ağacı başlığı") from None
+    if block_size == 0 or count == 0 or len(control) != HEADER_DIGITS + 4 * sum(level_sizes(count)):
+        raise ValueError("Blok ağacı uzunluğu tutarsız")
+    
+    values = [int(control[i:i + 4], 16) for i in range(HEADER_DIGITS, len(control), 4)]
+    levels = []
+    position = 0
+    for size in level_sizes(count):
+        levels.append(values[position:position + size])
+        position += size
+    return block_size, levels
+
+def locate(control, data):
+    # Kökten başlayıp yalnızca uyuşmayan düğümlerin çocuklarına inilir; k hasarlı
+    # blok için karşılaştırma sayısı O(k log n). Hasarlı bayt aralıkları, hasarlı
+    # blok sayısı ve yapılan karşılaştırma sayısı döner.
+    block_size, expected = decode(control)
+    count = len(expected[-1])
+    actual = build_levels(data, block_size, count)
+    
+    comparisons = 0
+    suspects = [0]
+    for depth, level in enumerate(expected):
+        mismatched = []
+        for index in suspects:
+            comparisons += 1
+            if level[index] != actual[depth][index]:
+                mismatched.append(index)
+        if depth + 1 < len(expected):
+            width = len(expected[depth + 1])
+            suspects = [child for index in mismatched for child in (2 * index, 2 * index + 1) if child < width]
+    
+    ranges = []
+    for block in mismatched:
+        start = block * block_size
+        end = max(start, min(start + block_size, len(data)) - 1)
+        if ranges and ranges[-1][1] + 1 == start:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    if len(data) > count * block_size:
+        # Eklemeyle uzayan yükün beklenen son bloğu aşan kısmı.
+        start = count * block_size
+        if ranges and ranges[-1][1] + 1 == start:
+            start = ranges.pop()[0]
+        ranges.append((start, len(data) - 1))
+    return ranges, len(mismatched), comparisons
+
+def format_ranges(ranges, limit=8):
+    shown = ', '.join(f"{start}-{end}" for start, end in ranges[:limit])
+    return shown + (" ..." if len(ranges) > limit else "")
@@ -0,0 +1,105 @@
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import namedtuple
+
+# Yakalama dosyası: MAGIC ardından kayıtlar. Her kayıt RECORD başlığı (tür,
+# uygulanan hata kimliği, zaman damgası ns, uzunluk) ve olduğu gibi hatta
+# gönderilebilecek çerçeve baytlarından oluşur.
+MAGIC = b'DCCAP\x00\x01\n'
+RECORD = struct.Struct('!BBQI')
+# Kayıtlar bu eşiklerden biri aşılınca diske yazılır; sunucu açıkken replay
+# aracı dosyayı okuyabilir ve çökmede en fazla bu kadarı kaybolur.
+FLUSH_BYTES = 64 * 1024
+FLUSH_INTERVAL = 1.0
+
+KIND_RECEIVED = 1
+KIND_CORRUPTED = 2
+KIND_NAMES = {KIND_RECEIVED: 'received', KIND_CORRUPTED: 'corrupted'}
+
+Record = namedtuple('Record', ['kind', 'error_id', 'timestamp', 'frame'])
+
+def worker_path(path, worker_id):
+    root, ext = os.path.splitext(path)
+    return f"{root}_w{worker_id}{ext}"
+
+class CaptureWriter:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'ab')
+        self.lock = threading.Lock()
+        self.records = 0
+        self.unflushed = 0
+        self.flushed_at = time.monotonic()
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+            self.file.flush()
+    
+    def record(self, kind, parts, error_id=0):
+        length = sum(len(part) for part in parts)
+        with self.lock:
+            self.file.write(RECORD.pack(kind, error_id, time.time_ns(), length))
+            for part in parts:
+                self.file.write(part)
+            self.records += 1
+            self.unflushed += RECORD.size + length
+            if (self.unflushed >= FLUSH_BYTES
+                    or time.monotonic() - self.flushed_at >= FLUSH_INTERVAL):
+                self.flush_locked()
+    
+    def flush(self):
+        with self.lock:
+            if self.unflushed:
+                self.flush_locked()
+    
+    def flush_locked(self):
+        self.file.flush()
+        self.unflushed = 0
+        self.flushed_at = time.monotonic()
+    
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+class CaptureLog:
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError(f"Boş yakalama dosyası: {path}") from None
+        if self.map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Geçersiz yakalama dosyası: {path}")
+    
+    def __iter__(self):
+        # Çerçeveler kopyalanmadan, eşlenmiş dosyaya bakan memoryview olarak
+        # verilir; yarım yazılmış son kayıt atlanır.
+        view = memoryview(self.map)
+        offset = len(MAGIC)
+        try:
+            while offset + RECORD.size <= len(view):
+                kind, error_id, timestamp, length = RECORD.unpack_from(view, offset)
+                start = offset + RECORD.size
+                offset = start + length
+                if offset > len(view):
+                    break
+                yield Record(kind, error_id, timestamp, view[start:offset])
+        finally:
+            view.release()
+    
+    def close(self):
+        try:
+            self.map.close()
+        except BufferError:
+            pass
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,55 @@
+import zlib
+
+# CRC-32C (Castagnoli) için yerel paket varsa C hızında hesaplanır; yoksa
+# tabloyla saf Python yedeği kullanılır (sonuçlar aynıdır, yalnızca yavaştır).
+try:
+    from crc32c import crc32c as native_crc32c
+except ImportError:
+    try:
+        from google_crc32c import value as native_crc32c
+    except ImportError:
+        native_crc32c = None
+
+CRC32C_POLYNOMIAL = 0x82F63B78
+FLETCHER_MODULUS = 255
+FLETCHER_SQUARE = FLETCHER_MODULUS * FLETCHER_MODULUS
+
+def crc32c_entry(byte):
+    crc = byte
+    for _ in range(8):
+        crc = (crc >> 1) ^ (CRC32C_POLYNOMIAL if crc & 1 else 0)
+    return crc
+
+CRC32C_TABLE = [crc32c_entry(b) for b in range(256)]
+
+def crc32(data):
+    return format(zlib.crc32(data), '08X')
+
+def python_crc32c(data):
+    crc = 0xFFFFFFFF
+    table = CRC32C_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc ^ 0xFFFFFFFF
+
+def crc32c(data):
+    value = native_crc32c(bytes(data)) if native_crc32c is not None else python_crc32c(data)
+    return format(value, '08X')
+
+def adler32(data):
+    return format(zlib.adler32(data), '08X')
+
+def fletcher16(data):
+    # 256 ≡ 1 + 255 (mod 255²) olduğundan 256^k ≡ 1 + 255·k; veriyi büyük ve
+    # küçük endian tamsayı olarak okuyup 255²'ye göre indirgemek iki toplamı
+    # (Σd ve Σ(n-1-i)·d) C hızında verir, bayt başına Python döngüsü olmaz.
+    n = len(data)
+    if not n:
+        return '0000'
+    big = int.from_bytes(data, 'big') % FLETCHER_SQUARE
+    little = int.from_bytes(data, 'little') % FLETCHER_SQUARE
+    total = (big + little) * pow(2 + FLETCHER_MODULUS * (n - 1), -1, FLETCHER_SQUARE) % FLETCHER_SQUARE
+    weighted = (big - total) % FLETCHER_SQUARE // FLETCHER_MODULUS
+    sum1 = total % FLETCHER_MODULUS
+    sum2 = (weighted + total) % FLETCHER_MODULUS
+    return format(sum2 << 8 | sum1, '04X')
@@ -1,7 +1,21 @@
 #!/usr/bin/env python3
 
+import argparse
+import binascii
+import os
 import socket
 import sys
+import threading
+import time
+
+import blocktree
+import checksums
+import fec
+from datagram import DATAGRAM_SIZE, DatagramBatcher, udp_socket
+from protocol import (
+    FLAG_ACK, FLAG_ARQ, FLAG_CHUNK, FLAG_LAST, FLAG_NAK, FLAG_TEXT, HEADER, FrameDecoder, encode_packet,
+    frame_flags
+)
 
 def text_to_binary(text):
     return ''.join(format(ord(c), '08b') for c in text)
@@ -10,84 +24,114 @@ def binary_to_text(binary):
     chars = [binary[i:i+8] for i in range(0, len(binary), 8)]
     return ''.join(chr(int(c, 2)) for c in chars if len(c) == 8)
 
+def text_to_bytes(text):
+    if isinstance(text, str):
+        return text.encode('utf-8')
+    return bytes(text)
+
+def text_to_bits(text):
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        data = bytes(text)
+        return data, len(data) * 8
+    try:
+        data = text.encode('latin-1')
+        return data, len(data) * 8
+    except UnicodeEncodeError:
+        binary = text_to_binary(text)
+        nbits = len(binary)
+        nbytes = (nbits + 7) // 8
+        return (int(binary, 2) << (nbytes * 8 - nbits)).to_bytes(nbytes, 'big'), nbits
+
+def xor_fold(data):
+    nbytes = len(data)
+    if nbytes == 0:
+        return 0
+    value = int.from_bytes(data, 'big')
+    while nbytes > 1:
+        half = (nbytes + 1) // 2
+        shift = half * 8
+        value = (value >> shift) ^ (value & ((1 << shift) - 1))
+        nbytes = half
+    return value
+
+def hamming_nibble_code(nibble):
+    d = [(nibble >> 3) & 1, (nibble >> 2) & 1, (nibble >> 1) & 1, nibble & 1]
+    
+    p1 = d[0] ^ d[1] ^ d[3]
+    p2 = d[0] ^ d[2] ^ d[3]
+    p4 = d[1] ^ d[2] ^ d[3]
+    
+    return (p1 << 2) | (p2 << 1) | p4
+
+PARITY_TABLE = bytes(bin(b).count('1') & 1 for b in range(256))
+PARITY_CHARS = bytes(b'01'[p] for p in PARITY_TABLE)
+HAMMING_NIBBLE_CODES = [hamming_nibble_code(n) for n in range(16)]
+HAMMING_BYTE_CODES = bytes(
+    (HAMMING_NIBBLE_CODES[b >> 4] << 3) | HAMMING_NIBBLE_CODES[b & 0x0F] for b in range(256)
+)
+HAMMING_PAIR_HEX = [format(i, '03X') for i in range(4096)]
+
 def calculate_parity(text):
-    binary = text_to_binary(text)
-    ones_count = binary.count('1')
-    parity_bit = '1' if ones_count % 2 != 0 else '0'
-    return parity_bit
+    data, _ = text_to_bits(text)
+    return '1' if PARITY_TABLE[xor_fold(data)] else '0'
 
 def calculate_2d_parity(text):
-    binary = text_to_binary(text)
-    
-    cols = 8
-    rows = (len(binary) + cols - 1) // cols
+    data, _ = text_to_bits(text)
     
-    padded_binary = binary.ljust(rows * cols, '0')
+    col_parities = xor_fold(data)
+    if not data:
+        return format(col_parities, 'X').zfill(4)
     
-    matrix = []
-    for i in range(rows):
-        row = list(padded_binary[i*cols:(i+1)*cols])
-        matrix.append(row)
+    row_parities = int(data.translate(PARITY_CHARS), 2)
+    return format((row_parities << 8) | col_parities, 'X').zfill(4)
+
+class CRC16:
+    def __init__(self, data=b''):
+        self.crc = 0xFFFF
+        if data:
+            self.update(data)
     
-    row_parities = []
-    for row in matrix:
-        ones = sum(int(b) for b in row)
-        row_parities.append('1' if ones % 2 != 0 else '0')
+    def update(self, chunk):
+        self.crc = binascii.crc_hqx(text_to_bytes(chunk), self.crc)
+        return self
     
-    col_parities = []
-    for j in range(cols):
-        ones = sum(int(matrix[i][j]) for i in range(rows))
-        col_parities.append('1' if ones % 2 != 0 else '0')
+    def digest(self):
+        return self.crc.to_bytes(2, 'big')
     
-    control_info = ''.join(row_parities) + ''.join(col_parities)
-    return format(int(control_info, 2), 'X').zfill(4) if control_info else '0'
+    def hexdigest(self):
+        return format(self.crc, '04X')
 
 def calculate_crc16(text):
-    data = text.encode('utf-8')
-    crc = 0xFFFF
-    polynomial = 0x1021
-    
-    for byte in data:
-        crc ^= (byte << 8)
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = (crc << 1) ^ polynomial
-            else:
-                crc <<= 1
-            crc &= 0xFFFF
-    
-    return format(crc, '04X')
+    return CRC16(text).hexdigest()
 
 def calculate_hamming(text):
-    binary = text_to_binary(text)
+    data, nbits = text_to_bits(text)
     
-    blocks = [binary[i:i+4] for i in range(0, len(binary), 4)]
-    
-    hamming_bits = []
-    for block in blocks:
-        if len(block) < 4:
-            block = block.ljust(4, '0')
-        
-        d = [int(b) for b in block]
-        
-        p1 = d[0] ^ d[1] ^ d[3]
-        p2 = d[0] ^ d[2] ^ d[3]
-        p4 = d[1] ^ d[2] ^ d[3]
-        
-        hamming_bits.extend([p1, p2, p4])
+    nibbles = (nbits + 3) // 4
+    full_bytes = nibbles // 2
+    codes = data[:full_bytes].translate(HAMMING_BYTE_CODES)
     
-    hamming_str = ''.join(str(b) for b in hamming_bits)
-    if len(hamming_str) % 4 != 0:
-        hamming_str = hamming_str.ljust((len(hamming_str) // 4 + 1) * 4, '0')
+    paired = full_bytes - full_bytes % 2
+    result = ''.join([
+        HAMMING_PAIR_HEX[(hi << 6) | lo]
+        for hi, lo in zip(codes[0:paired:2], codes[1:paired:2])
+    ])
     
-    result = ''
-    for i in range(0, len(hamming_str), 4):
-        result += format(int(hamming_str[i:i+4], 2), 'X')
+    tail = 0
+    tail_bits = 0
+    if full_bytes % 2:
+        tail, tail_bits = codes[-1], 6
+    if nibbles % 2:
+        tail = (tail << 3) | HAMMING_NIBBLE_CODES[data[full_bytes] >> 4]
+        tail_bits += 3
+    if tail_bits:
+        pad = -tail_bits % 4
+        result += format(tail << pad, 'X').zfill((tail_bits + pad) // 4)
     
     return result if result else '0'
 
 def calculate_checksum(text):
-    data = text.encode('utf-8')
+    data = text_to_bytes(text)
     
     if len(data) % 2 != 0:
         data += b'\x00'
@@ -116,11 +160,356 @@ def get_control_info(text, method):
         return calculate_hamming(text)
     elif method == 'CHECKSUM':
         return calculate_checksum(text)
+    elif method == 'FEC':
+        return calculate_crc16(text)
+    elif method == 'BLOCKTREE':
+        return blocktree.encode(text_to_bytes(text))
+    elif method == 'CRC32':
+        return checksums.crc32(text_to_bytes(text))
+    elif method == 'CRC32C':
+        return checksums.crc32c(text_to_bytes(text))
+    elif method == 'ADLER32':
+        return checksums.adler32(text_to_bytes(text))
+    elif method == 'FLETCHER16':
+        return checksums.fletcher16(text_to_bytes(text))
     else:
         raise ValueError(f"Bilinmeyen yöntem: {method}")
 
-def create_packet(data, method, control_info):
-    return f"{data}|{method}|{control_info}"
+METHOD_MAP = {
+    '1': 'PARITY', '2': '2DPARITY', '3': 'CRC16', '4': 'HAMMING', '5': 'CHECKSUM', '6': 'FEC',
+    '7': 'BLOCKTREE', '8': 'CRC32', '9': 'CRC32C', '10': 'ADLER32', '11': 'FLETCHER16'
+}
+
+BULK_BATCH_SIZE = 64
+BULK_BATCH_BYTES = 64 * 1024
+FILE_CHUNK_SIZE = 64 * 1024
+UDP_CHUNK_SIZE = 8 * 1024
+ARQ_WINDOW = 32
+ARQ_TIMEOUT = 1.0
+ARQ_MAX_RETRIES = 10
+
+def create_packet(data, method, control_info, legacy=False, stream_id=0, seq=0, flags=0):
+    if method.upper() == 'FEC':
+        # Yük Hamming SEC-DED ile kodlanır; kontrol değeri orijinal verinin CRC'sidir.
+        if legacy:
+            raise ValueError("FEC eski metin formatıyla kullanılamaz")
+        if isinstance(data, str):
+            flags |= FLAG_TEXT
+        data = fec.encode(text_to_bytes(data))
+    return encode_packet(data, method, control_info, stream_id, seq, flags,
+                         sent_at=time.time_ns(), legacy=legacy)
+
+def iter_messages(stream, chunk_size=None):
+    if chunk_size:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        for line in stream:
+            line = line.rstrip('\r\n')
+            if line:
+                yield line
+
+def count_replies(sock, replies):
+    buffer = b''
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        for line in lines:
+            if line.startswith(b'Hata'):
+                replies['error'] += 1
+            else:
+                replies['ok'] += 1
+
+def iter_file_chunks(path, chunk_size):
+    with open(path, 'rb') as f:
+        seq = 0
+        chunk = f.read(chunk_size)
+        while True:
+            next_chunk = f.read(chunk_size)
+            yield seq, chunk, not next_chunk
+            if not next_chunk:
+                break
+            chunk = next_chunk
+            seq += 1
+
+def send_packets(host, port, packets):
+    stats = {'packets': 0, 'payload_bytes': 0, 'wire_bytes': 0}
+    replies = {'ok': 0, 'error': 0}
+    
+    with socket.create_connection((host, port)) as client_socket:
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        reply_thread = threading.Thread(target=count_replies, args=(client_socket, replies), daemon=True)
+        reply_thread.start()
+        
+        start = time.perf_counter()
+        batch = []
+        batch_bytes = 0
+        for payload_size, packet in packets:
+            batch.append(packet)
+            batch_bytes += len(packet)
+            stats['packets'] += 1
+            stats['payload_bytes'] += payload_size
+            stats['wire_bytes'] += len(packet)
+            if len(batch) >= BULK_BATCH_SIZE or batch_bytes >= BULK_BATCH_BYTES:
+                client_socket.sendall(b''.join(batch))
+                batch.clear()
+                batch_bytes = 0
+        if batch:
+            client_socket.sendall(b''.join(batch))
+        
+        stats['send_time'] = time.perf_counter() - start
+        client_socket.shutdown(socket.SHUT_WR)
+        reply_thread.join()
+        stats['total_time'] = time.perf_counter() - start
+    
+    stats.update(replies)
+    return stats
+
+def send_datagrams(host, port, packets, datagram_size=DATAGRAM_SIZE):
+    # UDP'de yanıt yoktur: küçük çerçeveler datagram boyutuna kadar birleştirilir,
+    # kayıp ve bozulma alıcıda sıra numaraları ve kontrol bilgisiyle görülür.
+    stats = {'packets': 0, 'payload_bytes': 0, 'wire_bytes': 0}
+    
+    with udp_socket() as client_socket:
+        batcher = DatagramBatcher(client_socket, (host, port), datagram_size)
+        start = time.perf_counter()
+        for payload_size, packet in packets:
+            batcher.add(packet)
+            stats['packets'] += 1
+            stats['payload_bytes'] += payload_size
+            stats['wire_bytes'] += len(packet)
+        batcher.flush()
+        stats['send_time'] = stats['total_time'] = time.perf_counter() - start
+    
+    stats['datagrams'] = batcher.datagrams
+    return stats
+
+def send_arq(host, port, packets, window=ARQ_WINDOW, timeout=ARQ_TIMEOUT, max_retries=ARQ_MAX_RETRIES):
+    # Seçici tekrar (selective repeat): pencere en eski onaylanmamış paketten
+    # başlar; NAK alan veya zaman aşımına uğrayan paketler tek tek yeniden
+    # gönderilir. Paketlerin sıra numaraları 0'dan başlayıp gönderim sırasıyla artar.
+    stats = {'packets': 0, 'payload_bytes': 0, 'wire_bytes': 0, 'transmissions': 0, 'retransmissions': 0,
+             'acked': 0, 'acked_bytes': 0, 'naks': 0, 'timeouts': 0, 'failed': 0, 'ok': 0, 'error': 0}
+    outstanding = {}
+    resend = []
+    condition = threading.Condition()
+    closed = threading.Event()
+    
+    def read_feedback(sock):
+        decoder = FrameDecoder()
+        while True:
+            try:
+                frames, more = decoder.receive(sock)
+            except (OSError, ValueError):
+                frames, more = [], False
+            with condition:
+                for frame in frames:
+                    flags = frame_flags(frame)
+                    if not flags & (FLAG_ACK | FLAG_NAK):
+                        stats['error' if frame.startswith(b'Hata') else 'ok'] += 1
+                        continue
+                    seq = HEADER.unpack_from(frame)[5]
+                    entry = outstanding.get(seq)
+                    if entry is None:
+                        continue
+                    if flags & FLAG_ACK:
+                        del outstanding[seq]
+                        stats['acked'] += 1
+                        stats['acked_bytes'] += entry[3]
+                    else:
+                        stats['naks'] += 1
+                        resend.append(seq)
+                if not more:
+                    closed.set()
+                condition.notify()
+            if not more:
+                decoder.close()
+                return
+    
+    def schedule(seq, entry, now, batch):
+        if entry[2] > max_retries:
+            del outstanding[seq]
+            stats['failed'] += 1
+            return
+        entry[1] = now + timeout
+        entry[2] += 1
+        batch.append(entry[0])
+        stats['transmissions'] += 1
+        stats['wire_bytes'] += len(entry[0])
+        if entry[2] > 1:
+            stats['retransmissions'] += 1
+    
+    with socket.create_connection((host, port)) as client_socket:
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        reader = threading.Thread(target=read_feedback, args=(client_socket,), daemon=True)
+        reader.start()
+        
+        start = time.perf_counter()
+        packets = iter(packets)
+        next_seq = 0
+        exhausted = False
+        while True:
+            batch = []
+            with condition:
+                now = time.monotonic()
+                for seq in set(resend):
+                    if seq in outstanding:
+                        schedule(seq, outstanding[seq], now, batch)
+                resend.clear()
+                for seq, entry in list(outstanding.items()):
+                    if entry[1] <= now:
+                        stats['timeouts'] += 1
+                        schedule(seq, entry, now, batch)
+                
+                base = min(outstanding) if outstanding else next_seq
+                while not exhausted and next_seq < base + window:
+                    try:
+                        payload_size, packet = next(packets)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    entry = outstanding[next_seq] = [packet, 0, 0, payload_size]
+                    stats['packets'] += 1
+                    stats['payload_bytes'] += payload_size
+                    schedule(next_seq, entry, now, batch)
+                    next_seq += 1
+                
+                if (exhausted and not outstanding) or closed.is_set():
+                    stats['failed'] += len(outstanding)
+                    break
+                if not batch:
+                    deadline = min(entry[1] for entry in outstanding.values())
+                    condition.wait(max(0.0, deadline - now))
+                    continue
+            client_socket.sendall(b''.join(batch))
+        
+        stats['send_time'] = time.perf_counter() - start
+        client_socket.shutdown(socket.SHUT_WR)
+        reader.join()
+        stats['total_time'] = time.perf_counter() - start
+    
+    return stats
+
+def send_bulk(host, port, messages, method, legacy=False, arq=None, udp=None):
+    stream_id = int.from_bytes(os.urandom(4), 'big')
+    
+    def packets():
+        for seq, text in enumerate(messages):
+            control_info = get_control_info(text, method)
+            if arq is not None:
+                packet = create_packet(text, method, control_info, stream_id=stream_id, seq=seq, flags=FLAG_ARQ)
+            elif udp is not None:
+                # Alıcı kayıpları akış içindeki sıra boşluklarından sayar.
+                packet = create_packet(text, method, control_info, stream_id=stream_id, seq=seq)
+            else:
+                packet = create_packet(text, method, control_info, legacy=legacy)
+            yield len(text.encode('utf-8')), packet
+    
+    if arq is not None:
+        return send_arq(host, port, packets(), **arq)
+    if udp is not None:
+        return send_datagrams(host, port, packets(), **udp)
+    return send_packets(host, port, packets())
+
+def send_file(host, port, path, method, chunk_size=FILE_CHUNK_SIZE, arq=None, udp=None):
+    stream_id = int.from_bytes(os.urandom(4), 'big')
+    
+    def packets():
+        for seq, chunk, last in iter_file_chunks(path, chunk_size):
+            flags = FLAG_CHUNK | (FLAG_LAST if last else 0) | (FLAG_ARQ if arq is not None else 0)
+            control_info = get_control_info(chunk, method)
+            yield len(chunk), create_packet(chunk, method, control_info, stream_id=stream_id, seq=seq, flags=flags)
+    
+    print(f"Akış kimliği: {stream_id:08x}")
+    if arq is not None:
+        return send_arq(host, port, packets(), **arq)
+    if udp is not None:
+        return send_datagrams(host, port, packets(), **udp)
+    return send_packets(host, port, packets())
+
+def display_bulk_stats(stats):
+    elapsed = max(stats['total_time'], 1e-9)
+    print("\n" + "-"*60)
+    print("TOPLU GÖNDERİM SONUCU:")
+    print(f"  Gönderilen Paket : {stats['packets']}")
+    if 'datagrams' in stats:
+        print(f"  UDP Datagramı    : {stats['datagrams']} (yanıt beklenmez)")
+    else:
+        print(f"  Onaylanan Paket  : {stats['ok']}")
+        print(f"  Hatalı Yanıt     : {stats['error']}")
+    print(f"  Veri / Hat Baytı : {stats['payload_bytes']} / {stats['wire_bytes']}")
+    print(f"  Gönderim Süresi  : {stats['send_time']:.3f} s")
+    print(f"  Toplam Süre      : {stats['total_time']:.3f} s")
+    print(f"  Paket Hızı       : {stats['packets'] / elapsed:.1f} paket/s")
+    print(f"  Veri Hızı        : {stats['payload_bytes'] / elapsed:.1f} bayt/s")
+    print("-"*60)
+
+def display_arq_stats(stats):
+    elapsed = max(stats['total_time'], 1e-9)
+    transmissions = max(stats['transmissions'], 1)
+    print("\n" + "-"*60)
+    print("ARQ GÖNDERİM SONUCU:")
+    print(f"  Paket            : {stats['packets']}")
+    print(f"  Onaylanan (ACK)  : {stats['acked']}")
+    print(f"  Teslim Edilemeyen: {stats['failed']}")
+    print(f"  Toplam İletim    : {stats['transmissions']} ({stats['retransmissions']} yeniden)")
+    print(f"  NAK / Zaman Aşımı: {stats['naks']} / {stats['timeouts']}")
+    print(f"  Verimlilik       : {stats['acked'] / transmissions * 100:.1f}% (onaylanan / iletim)")
+    print(f"  Toplam Süre      : {stats['total_time']:.3f} s")
+    print(f"  Goodput          : {stats['acked_bytes'] / elapsed:.1f} bayt/s "
+          f"({stats['acked'] / elapsed:.1f} paket/s)")
+    print(f"  Hat Verisi       : {stats['wire_bytes'] / elapsed:.1f} bayt/s")
+    print("-"*60)
+
+def arq_options(args):
+    if not args.arq:
+        return None
+    return {'window': args.window, 'timeout': args.arq_timeout, 'max_retries': args.max_retries}
+
+def udp_options(args):
+    if not args.udp:
+        return None
+    return {'datagram_size': args.datagram_size}
+
+def run_file_transfer(host, port, args):
+    method = METHOD_MAP.get(args.method.upper(), args.method.upper())
+    chunk_size = args.chunk_size or (UDP_CHUNK_SIZE if args.udp else FILE_CHUNK_SIZE)
+    
+    try:
+        print(f"Parçalı aktarım: {args.send_file} → {host}:{port} ({method}, {chunk_size} baytlık parçalar"
+              + (", UDP)" if args.udp else ")"))
+        stats = send_file(host, port, args.send_file, method, chunk_size, arq=arq_options(args),
+                          udp=udp_options(args))
+        (display_arq_stats if args.arq else display_bulk_stats)(stats)
+    except ConnectionRefusedError:
+        print(f"\n✗ Hata: Server'a bağlanılamadı! Server'ın çalıştığından emin olun.")
+        print(f"  Önce 'python3 server.py' komutunu çalıştırın.")
+    except (OSError, ValueError) as e:
+        print(f"\n✗ Hata: {e}")
+
+def run_bulk(host, port, args):
+    method = METHOD_MAP.get(args.method.upper(), args.method.upper())
+    stream = sys.stdin if args.bulk == '-' else open(args.bulk, encoding='utf-8')
+    
+    try:
+        print(f"Toplu gönderim: {args.bulk} → {host}:{port} ({method}" + (", UDP)" if args.udp else ")"))
+        stats = send_bulk(host, port, iter_messages(stream, args.chunk_size), method, legacy=args.legacy,
+                          arq=arq_options(args), udp=udp_options(args))
+        (display_arq_stats if args.arq else display_bulk_stats)(stats)
+    except ConnectionRefusedError:
+        print(f"\n✗ Hata: Server'a bağlanılamadı! Server'ın çalıştığından emin olun.")
+        print(f"  Önce 'python3 server.py' komutunu çalıştırın.")
+    except (OSError, ValueError) as e:
+        print(f"\n✗ Hata: {e}")
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
 
 def display_menu():
     print("\n" + "="*60)
@@ -132,12 +521,72 @@ def display_menu():
     print("  3. CRC16       - CRC-16 (CCITT)")
     print("  4. HAMMING     - Hamming Code")
     print("  5. CHECKSUM    - Internet Checksum")
+    print("  6. FEC         - Hamming(8,4) SEC-DED (alıcıda düzeltme)")
+    print("  7. BLOCKTREE   - Blok CRC ağacı (hasarlı bölgeyi bulur)")
+    print("  8. CRC32       - CRC-32 (IEEE, zlib)")
+    print("  9. CRC32C      - CRC-32C (Castagnoli" + (")" if checksums.native_crc32c else ", saf Python yedeği)"))
+    print(" 10. ADLER32     - Adler-32 (zlib)")
+    print(" 11. FLETCHER16  - Fletcher-16")
     print("-"*60)
 
 def main():
     SERVER_HOST = 'localhost'
     SERVER_PORT = 5000
     
+    parser = argparse.ArgumentParser(description="Client 1 - veri gönderici")
+    parser.add_argument('--legacy', action='store_true',
+                        help="Eski 'veri|yöntem|kontrol' metin paket formatını kullan")
+    parser.add_argument('--bulk', metavar='DOSYA',
+                        help="Etkileşimsiz toplu gönderim: mesajları dosyadan ('-' için stdin) oku")
+    parser.add_argument('--method', default='CRC16',
+                        help="Toplu gönderimde hata tespit yöntemi (numara veya isim, varsayılan: CRC16)")
+    parser.add_argument('--chunk-size', type=int, metavar='N',
+                        help="Satır yerine N karakterlik sabit parçalar halinde gönder "
+                             "(--send-file ile N bayt, varsayılan: 65536)")
+    parser.add_argument('--send-file', metavar='DOSYA',
+                        help="Büyük bir dosyayı parça başına kontrol bilgisiyle aktar")
+    parser.add_argument('--arq', action='store_true',
+                        help="Seçici tekrar ARQ: Client 2'nin ACK/NAK yanıtlarıyla bozuk paketleri yeniden gönder")
+    parser.add_argument('--window', type=int, default=ARQ_WINDOW, metavar='N',
+                        help=f"ARQ gönderim penceresi, paket (varsayılan: {ARQ_WINDOW})")
+    parser.add_argument('--arq-timeout', type=float, default=ARQ_TIMEOUT, metavar='SANİYE',
+                        help=f"Yanıtsız paketin yeniden gönderilme süresi (varsayılan: {ARQ_TIMEOUT})")
+    parser.add_argument('--max-retries', type=int, default=ARQ_MAX_RETRIES, metavar='N',
+                        help=f"Paket başına en fazla yeniden gönderim (varsayılan: {ARQ_MAX_RETRIES})")
+    parser.add_argument('--udp', action='store_true',
+                        help="Paketleri TCP yerine UDP datagramlarıyla gönder (yanıt ve yeniden gönderim yok)")
+    parser.add_argument('--datagram-size', type=int, default=DATAGRAM_SIZE, metavar='BAYT',
+                        help=f"Küçük paketlerin birleştirileceği datagram boyutu (varsayılan: {DATAGRAM_SIZE})")
+    args = parser.parse_args()
+    
+    if args.arq:
+        if args.legacy:
+            parser.error("--arq eski metin formatıyla kullanılamaz")
+        if not (args.bulk or args.send_file):
+            parser.error("--arq yalnızca --bulk veya --send-file ile kullanılabilir")
+        if args.window < 1:
+            parser.error("--window en az 1 olmalı")
+    
+    if args.udp:
+        if args.legacy:
+            parser.error("--udp eski metin formatıyla kullanılamaz")
+        if args.arq:
+            parser.error("--udp ile --arq birlikte kullanılamaz (geri bildirim kanalı yok)")
+    
+    if args.chunk_size and args.legacy and not args.send_file:
+        # Sabit boyutlu parçalar satır sonu içerebilir; eski format satır sonuyla ayrılır.
+        parser.error("--chunk-size eski metin formatıyla kullanılamaz")
+    
+    if args.send_file:
+        if args.legacy:
+            parser.error("--send-file eski metin formatıyla kullanılamaz")
+        run_file_transfer(SERVER_HOST, SERVER_PORT, args)
+        return
+    
+    if args.bulk:
+        run_bulk(SERVER_HOST, SERVER_PORT, args)
+        return
+    
     display_menu()
     
     print("\nGöndermek istediğiniz metni girin:")
@@ -150,34 +599,36 @@ def main():
     print("\nHata tespit yöntemini seçin (numara veya isim):")
     method_input = input("> ").strip().upper()
     
-    method_map = {
-        '1': 'PARITY', '2': '2DPARITY', '3': 'CRC16', '4': 'HAMMING', '5': 'CHECKSUM'
-    }
-    
-    method = method_map.get(method_input, method_input)
+    method = METHOD_MAP.get(method_input, method_input)
     
     try:
         control_info = get_control_info(text, method)
-        packet = create_packet(text, method, control_info)
+        packet = create_packet(text, method, control_info, legacy=args.legacy)
         
         print("\n" + "-"*60)
         print("PAKET BİLGİLERİ:")
         print(f"  Veri          : {text}")
         print(f"  Yöntem        : {method}")
         print(f"  Kontrol Bilgisi: {control_info}")
-        print(f"  Paket         : {packet}")
+        print(f"  Paket         : {text}|{method}|{control_info} ({len(packet)} bayt)")
         print("-"*60)
         
+        if args.udp:
+            with udp_socket() as client_socket:
+                client_socket.sendto(packet, (SERVER_HOST, SERVER_PORT))
+            print(f"✓ Paket UDP ile gönderildi: {len(packet)} bayt (yanıt beklenmez)")
+            return
+        
         print(f"\nServer'a bağlanılıyor ({SERVER_HOST}:{SERVER_PORT})...")
         
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as client_socket:
             client_socket.connect((SERVER_HOST, SERVER_PORT))
             print("✓ Bağlantı kuruldu!")
             
-            client_socket.sendall(packet.encode('utf-8'))
-            print(f"✓ Paket gönderildi: {packet}")
+            client_socket.sendall(packet)
+            print(f"✓ Paket gönderildi: {len(packet)} bayt")
             
-            response = client_socket.recv(1024).decode('utf-8')
+            response = client_socket.recv(1024).decode('utf-8').strip()
             print(f"✓ Server yanıtı: {response}")
             
     except ConnectionRefusedError:
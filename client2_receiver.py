@@ -1,90 +1,156 @@
 #!/usr/bin/env python3
 
+import argparse
+import binascii
+import concurrent.futures
+import hashlib
+import itertools
+import multiprocessing
+import os
+import queue
 import socket
 import threading
+import time
 import sys
+from collections import OrderedDict
+
+import blocktree
+import checksums
+import fec
+from console import (
+    add_logging_arguments, begin_packet, configure_logging, flush_logs, log_detail, log_info, log_warning,
+    logging_settings
+)
+from datagram import receive_batch, split_datagram, udp_socket
+from metrics import Registry, start_metrics_server
+from protocol import (
+    ERROR_LABELS, FLAG_ARQ, FLAG_CHUNK, FLAG_LAST, FLAG_TEXT, FrameDecoder, Packet, decode_packet,
+    describe_data, encode_feedback
+)
+from workers import WorkerGroup, reuse_port_socket
+
+# numpy isteğe bağlıdır (requirements-optional.txt); yoksa toplu doğrulama
+# yöntem başına skaler yola düşer. CRC16 ve FEC her zaman skaler binascii
+# yolundan hesaplanır, numpy ile toplu hesaplamaları daha hızlı değildir.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_MISSING = ("numpy kurulu değil; toplu doğrulama skaler yoldan yapılacak "
+                 "(pip install -r requirements-optional.txt)")
 
 def text_to_binary(text):
     return ''.join(format(ord(c), '08b') for c in text)
 
+def text_to_bytes(text):
+    if isinstance(text, str):
+        return text.encode('utf-8')
+    return bytes(text)
+
+def text_to_bits(text):
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        data = bytes(text)
+        return data, len(data) * 8
+    try:
+        data = text.encode('latin-1')
+        return data, len(data) * 8
+    except UnicodeEncodeError:
+        binary = text_to_binary(text)
+        nbits = len(binary)
+        nbytes = (nbits + 7) // 8
+        return (int(binary, 2) << (nbytes * 8 - nbits)).to_bytes(nbytes, 'big'), nbits
+
+def xor_fold(data):
+    nbytes = len(data)
+    if nbytes == 0:
+        return 0
+    value = int.from_bytes(data, 'big')
+    while nbytes > 1:
+        half = (nbytes + 1) // 2
+        shift = half * 8
+        value = (value >> shift) ^ (value & ((1 << shift) - 1))
+        nbytes = half
+    return value
+
+def hamming_nibble_code(nibble):
+    d = [(nibble >> 3) & 1, (nibble >> 2) & 1, (nibble >> 1) & 1, nibble & 1]
+    
+    p1 = d[0] ^ d[1] ^ d[3]
+    p2 = d[0] ^ d[2] ^ d[3]
+    p4 = d[1] ^ d[2] ^ d[3]
+    
+    return (p1 << 2) | (p2 << 1) | p4
+
+PARITY_TABLE = bytes(bin(b).count('1') & 1 for b in range(256))
+PARITY_CHARS = bytes(b'01'[p] for p in PARITY_TABLE)
+HAMMING_NIBBLE_CODES = [hamming_nibble_code(n) for n in range(16)]
+HAMMING_BYTE_CODES = bytes(
+    (HAMMING_NIBBLE_CODES[b >> 4] << 3) | HAMMING_NIBBLE_CODES[b & 0x0F] for b in range(256)
+)
+HAMMING_PAIR_HEX = [format(i, '03X') for i in range(4096)]
+
 def calculate_parity(text):
-    binary = text_to_binary(text)
-    ones_count = binary.count('1')
-    parity_bit = '1' if ones_count % 2 != 0 else '0'
-    return parity_bit
+    data, _ = text_to_bits(text)
+    return '1' if PARITY_TABLE[xor_fold(data)] else '0'
 
 def calculate_2d_parity(text):
-    binary = text_to_binary(text)
-    
-    cols = 8
-    rows = (len(binary) + cols - 1) // cols
+    data, _ = text_to_bits(text)
     
-    padded_binary = binary.ljust(rows * cols, '0')
+    col_parities = xor_fold(data)
+    if not data:
+        return format(col_parities, 'X').zfill(4)
     
-    matrix = []
-    for i in range(rows):
-        row = list(padded_binary[i*cols:(i+1)*cols])
-        matrix.append(row)
+    row_parities = int(data.translate(PARITY_CHARS), 2)
+    return format((row_parities << 8) | col_parities, 'X').zfill(4)
+
+class CRC16:
+    def __init__(self, data=b''):
+        self.crc = 0xFFFF
+        if data:
+            self.update(data)
     
-    row_parities = []
-    for row in matrix:
-        ones = sum(int(b) for b in row)
-        row_parities.append('1' if ones % 2 != 0 else '0')
+    def update(self, chunk):
+        self.crc = binascii.crc_hqx(text_to_bytes(chunk), self.crc)
+        return self
     
-    col_parities = []
-    for j in range(cols):
-        ones = sum(int(matrix[i][j]) for i in range(rows))
-        col_parities.append('1' if ones % 2 != 0 else '0')
+    def digest(self):
+        return self.crc.to_bytes(2, 'big')
     
-    control_info = ''.join(row_parities) + ''.join(col_parities)
-    return format(int(control_info, 2), 'X').zfill(4) if control_info else '0'
+    def hexdigest(self):
+        return format(self.crc, '04X')
 
 def calculate_crc16(text):
-    data = text.encode('utf-8')
-    crc = 0xFFFF
-    polynomial = 0x1021
-    
-    for byte in data:
-        crc ^= (byte << 8)
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = (crc << 1) ^ polynomial
-            else:
-                crc <<= 1
-            crc &= 0xFFFF
-    
-    return format(crc, '04X')
+    return CRC16(text).hexdigest()
 
 def calculate_hamming(text):
-    binary = text_to_binary(text)
+    data, nbits = text_to_bits(text)
     
-    blocks = [binary[i:i+4] for i in range(0, len(binary), 4)]
+    nibbles = (nbits + 3) // 4
+    full_bytes = nibbles // 2
+    codes = data[:full_bytes].translate(HAMMING_BYTE_CODES)
     
-    hamming_bits = []
-    for block in blocks:
-        if len(block) < 4:
-            block = block.ljust(4, '0')
-        
-        d = [int(b) for b in block]
-        
-        p1 = d[0] ^ d[1] ^ d[3]
-        p2 = d[0] ^ d[2] ^ d[3]
-        p4 = d[1] ^ d[2] ^ d[3]
-        
-        hamming_bits.extend([p1, p2, p4])
+    paired = full_bytes - full_bytes % 2
+    result = ''.join([
+        HAMMING_PAIR_HEX[(hi << 6) | lo]
+        for hi, lo in zip(codes[0:paired:2], codes[1:paired:2])
+    ])
     
-    hamming_str = ''.join(str(b) for b in hamming_bits)
-    if len(hamming_str) % 4 != 0:
-        hamming_str = hamming_str.ljust((len(hamming_str) // 4 + 1) * 4, '0')
-    
-    result = ''
-    for i in range(0, len(hamming_str), 4):
-        result += format(int(hamming_str[i:i+4], 2), 'X')
+    tail = 0
+    tail_bits = 0
+    if full_bytes % 2:
+        tail, tail_bits = codes[-1], 6
+    if nibbles % 2:
+        tail = (tail << 3) | HAMMING_NIBBLE_CODES[data[full_bytes] >> 4]
+        tail_bits += 3
+    if tail_bits:
+        pad = -tail_bits % 4
+        result += format(tail << pad, 'X').zfill((tail_bits + pad) // 4)
     
     return result if result else '0'
 
 def calculate_checksum(text):
-    data = text.encode('utf-8')
+    data = text_to_bytes(text)
     
     if len(data) % 2 != 0:
         data += b'\x00'
@@ -113,59 +179,426 @@ def get_control_info(text, method):
         return calculate_hamming(text)
     elif method == 'CHECKSUM':
         return calculate_checksum(text)
+    elif method == 'FEC':
+        return calculate_crc16(text)
+    elif method == 'BLOCKTREE':
+        return blocktree.encode(text_to_bytes(text))
+    elif method == 'CRC32':
+        return checksums.crc32(text_to_bytes(text))
+    elif method == 'CRC32C':
+        return checksums.crc32c(text_to_bytes(text))
+    elif method == 'ADLER32':
+        return checksums.adler32(text_to_bytes(text))
+    elif method == 'FLETCHER16':
+        return checksums.fletcher16(text_to_bytes(text))
     else:
         raise ValueError(f"Bilinmeyen yöntem: {method}")
 
-def verify_packet(packet):
+def pack_payloads(chunks, align=1):
+    lengths = np.fromiter((len(c) for c in chunks), dtype=np.int64, count=len(chunks))
+    if align > 1:
+        chunks = [c + bytes(-len(c) % align) if len(c) % align else c for c in chunks]
+    padded = lengths + (-lengths % align)
+    starts = np.zeros(len(chunks), dtype=np.int64)
+    np.cumsum(padded[:-1], out=starts[1:])
+    buffer = np.frombuffer(b''.join(chunks), dtype=np.uint8)
+    return buffer, starts, lengths
+
+def pack_bit_payloads(payloads, align=1):
+    chunks = []
+    fallback = []
+    for i, payload in enumerate(payloads):
+        data, nbits = text_to_bits(payload)
+        if nbits != len(data) * 8:
+            fallback.append(i)
+            data = b''
+        chunks.append(data)
+    return pack_payloads(chunks, align) + (fallback,)
+
+def segment_reduce(ufunc, values, starts, lengths):
+    result = np.zeros(len(starts), dtype=values.dtype)
+    nonempty = lengths > 0
+    if nonempty.any():
+        result[nonempty] = ufunc.reduceat(values, starts[nonempty])
+    return result
+
+def batch_parity(payloads):
+    buffer, starts, lengths, fallback = pack_bit_payloads(payloads)
+    folded = segment_reduce(np.bitwise_xor, buffer, starts, lengths)
+    parity = np.frombuffer(PARITY_TABLE, dtype=np.uint8)[folded]
+    return ['1' if p else '0' for p in parity.tolist()], fallback
+
+def batch_2d_parity(payloads):
+    buffer, starts, lengths, fallback = pack_bit_payloads(payloads)
+    col_parities = segment_reduce(np.bitwise_xor, buffer, starts, lengths).tolist()
+    row_chars = np.frombuffer(PARITY_CHARS, dtype=np.uint8)[buffer].tobytes()
+    
+    results = []
+    for start, length, col in zip(starts.tolist(), lengths.tolist(), col_parities):
+        value = col
+        if length:
+            value |= int(row_chars[start:start + length], 2) << 8
+        results.append(format(value, 'X').zfill(4))
+    return results, fallback
+
+def batch_hamming(payloads):
+    buffer, starts, lengths, fallback = pack_bit_payloads(payloads, align=2)
+    codes = np.frombuffer(HAMMING_BYTE_CODES, dtype=np.uint8)[buffer]
+    hi = codes[0::2]
+    lo = codes[1::2]
+    nibbles = np.stack([hi >> 2, ((hi & 0x03) << 2) | (lo >> 4), lo & 0x0F], axis=1)
+    hex_chars = np.frombuffer(b'0123456789ABCDEF', dtype=np.uint8)[nibbles].tobytes()
+    
+    results = []
+    for start, length in zip(starts.tolist(), lengths.tolist()):
+        first = start // 2 * 3
+        results.append(hex_chars[first:first + (3 * length + 1) // 2].decode('ascii') or '0')
+    return results, fallback
+
+def batch_checksum(payloads):
+    buffer, starts, lengths = pack_payloads([text_to_bytes(p) for p in payloads], align=2)
+    words = buffer.view('>u2').astype(np.uint64)
+    sums = segment_reduce(np.add, words, starts // 2, (lengths + 1) // 2)
+    while (sums > 0xFFFF).any():
+        sums = (sums & 0xFFFF) + (sums >> 16)
+    return [format(~s & 0xFFFF, '04X') for s in sums.tolist()], []
+
+BATCH_METHODS = {
+    'PARITY': batch_parity,
+    '2DPARITY': batch_2d_parity,
+    'HAMMING': batch_hamming,
+    'CHECKSUM': batch_checksum,
+}
+
+def get_control_info_batch(payloads, method):
+    method = method.upper()
+    payloads = list(payloads)
+    
+    if np is None or not payloads or method not in BATCH_METHODS:
+        return [get_control_info(text, method) for text in payloads]
+    
+    results, fallback = BATCH_METHODS[method](payloads)
+    for i in fallback:
+        results[i] = get_control_info(payloads[i], method)
+    return results
+
+class ControlCache:
+    # Tekrarlanan yükler (heartbeat, şablon mesajlar) için hesaplanmış kontrol
+    # değerlerinin sınırlı LRU önbelleği; anahtar yükün BLAKE2b özetidir.
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def key(self, data, method):
+        raw = data.encode('utf-8') if isinstance(data, str) else data
+        return method.upper(), isinstance(data, str), hashlib.blake2b(raw, digest_size=16).digest()
+    
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+    
+    def control_info(self, data, method):
+        key = self.key(data, method)
+        value = self.get(key)
+        if value is not None:
+            return value, True
+        value = get_control_info(data, method)
+        self.put(key, value)
+        return value, False
+
+process_cache = None
+
+def init_verify_worker(cache_size):
+    global process_cache
+    process_cache = ControlCache(cache_size) if cache_size else None
+
+def correct_packet(packet):
+    # FEC yükü kontrol değeri hesaplanmadan önce çözülüp düzeltilir; kontrol
+    # değeri düzeltilmiş verinin doğruluğunu onaylar.
+    if packet.method.upper() != 'FEC':
+        return packet, None
+    data, corrected, uncorrectable = fec.decode(packet.data)
+    if packet.flags & FLAG_TEXT:
+        data = data.decode('utf-8', errors='replace')
+    return packet._replace(data=data), (corrected, uncorrectable)
+
+def build_result(packet, computed_control, cached=None, corrections=None):
+    data, method, received_control = packet[:3]
+    
+    is_valid = (received_control == computed_control)
+    
+    damage = None
+    if not is_valid and method.upper() == 'BLOCKTREE':
+        # Hasar, gönderenin ağacıyla kökten aşağı karşılaştırılarak bulunur.
+        try:
+            damage = blocktree.locate(received_control, text_to_bytes(data))
+        except ValueError:
+            damage = None
+    
+    return {
+        'data': data,
+        'method': method,
+        'received_control': received_control,
+        'computed_control': computed_control,
+        'is_valid': is_valid,
+        'stream_id': packet.stream_id,
+        'seq': packet.seq,
+        'flags': packet.flags,
+        'error_id': packet.error_id,
+        'sent_at': packet.sent_at,
+        'cached': cached,
+        'fec': corrections,
+        'damage': damage
+    }
+
+def verify_packet(packet, cache=None):
     try:
-        parts = packet.split('|')
-        if len(parts) != 3:
-            return None, "Geçersiz paket formatı"
-        
-        data, method, received_control = parts
+        corrections = None
+        if not isinstance(packet, Packet):
+            packet, corrections = correct_packet(decode_packet(packet))
         
-        computed_control = get_control_info(data, method)
+        if cache is None:
+            return build_result(packet, get_control_info(packet.data, packet.method), None, corrections), None
         
-        is_valid = (received_control == computed_control)
-        
-        return {
-            'data': data,
-            'method': method,
-            'received_control': received_control,
-            'computed_control': computed_control,
-            'is_valid': is_valid
-        }, None
+        computed_control, cached = cache.control_info(packet.data, packet.method)
+        return build_result(packet, computed_control, cached, corrections), None
         
     except Exception as e:
         return None, str(e)
 
+def verify_frames(frames):
+    # Süreç havuzunda çalışır: çerçeveler çözülür, yönteme göre gruplanıp
+    # get_control_info_batch ile tek seferde hesaplanır. Sonuçlar giriş
+    # sırasıyla (result, error) çiftleri olarak döner.
+    start = time.perf_counter()
+    outcomes = [None] * len(frames)
+    groups = {}
+    corrections = {}
+    
+    for i, frame in enumerate(frames):
+        try:
+            packet, corrections[i] = correct_packet(decode_packet(frame))
+        except Exception as e:
+            outcomes[i] = (None, str(e))
+            continue
+        groups.setdefault(packet.method, []).append((i, packet))
+    
+    for method, group in groups.items():
+        keys = None
+        if process_cache is not None:
+            # Önbellekte olanlar hemen sonuçlanır; kalanlar toplu hesaplanır.
+            keys = {}
+            misses = []
+            for i, packet in group:
+                key = process_cache.key(packet.data, method)
+                computed_control = process_cache.get(key)
+                if computed_control is None:
+                    keys[i] = key
+                    misses.append((i, packet))
+                else:
+                    outcomes[i] = (build_result(packet, computed_control, True, corrections[i]), None)
+            group = misses
+        
+        try:
+            controls = get_control_info_batch([packet.data for _, packet in group], method)
+        except Exception:
+            for i, packet in group:
+                result, error = outcomes[i] = verify_packet(packet, process_cache)
+                if result is not None:
+                    result['fec'] = corrections[i]
+            continue
+        for (i, packet), computed_control in zip(group, controls):
+            if keys is not None:
+                process_cache.put(keys[i], computed_control)
+            outcomes[i] = (build_result(packet, computed_control, None if keys is None else False,
+                                        corrections[i]), None)
+    
+    return outcomes, (time.perf_counter() - start) / max(1, len(frames))
+
 def display_result(result):
-    print("\n" + "="*60)
-    print("       VERİ DOĞRULAMA SONUCU")
-    print("="*60)
-    print(f"  Alınan Veri      : {result['data']}")
-    print(f"  Yöntem           : {result['method']}")
-    print(f"  Gelen Kontrol    : {result['received_control']}")
-    print(f"  Hesaplanan Kontrol: {result['computed_control']}")
-    print("-"*60)
+    lines = [
+        "\n" + "="*60,
+        "       VERİ DOĞRULAMA SONUCU",
+        "="*60,
+        f"  Alınan Veri      : {describe_data(result['data'])}",
+        f"  Yöntem           : {result['method']}",
+        f"  Gelen Kontrol    : {result['received_control']}",
+        f"  Hesaplanan Kontrol: {result['computed_control']}",
+    ]
+    if result['fec'] is not None:
+        corrected, uncorrectable = result['fec']
+        lines.append(f"  FEC Düzeltme     : {corrected} sözcük düzeltildi, {uncorrectable} düzeltilemedi")
+    if result['damage'] is not None:
+        ranges, blocks, comparisons = result['damage']
+        lines.append(f"  Hasarlı Bloklar  : {blocks} blok ({comparisons} karşılaştırma)")
+        lines.append(f"  Hasarlı Baytlar  : {blocktree.format_ranges(ranges)}")
+    lines.append("-"*60)
     
     if result['is_valid']:
-        print("  ✓ Status         : DATA CORRECT")
-        print("    Veri başarıyla doğrulandı - Hata tespit edilmedi.")
+        lines.append("  ✓ Status         : DATA CORRECT")
+        lines.append("    Veri başarıyla doğrulandı - Hata tespit edilmedi.")
     else:
-        print("  ✗ Status         : DATA CORRUPTED")
-        print("    Veri bozulmuş - Hata tespit edildi!")
+        lines.append("  ✗ Status         : DATA CORRUPTED")
+        lines.append("    Veri bozulmuş - Hata tespit edildi!")
     
-    print("="*60)
+    lines.append("="*60)
+    log_detail("\n".join(lines))
+
+# Bu süre boyunca paket gelmeyen aktarımlar eksik olarak kapatılır ve ARQ
+# pencereleri atılır; tamamlanan akışların kimlikleri geç gelen tekrarları
+# tanımak için sınırlı sayıda saklanır.
+IDLE_TIMEOUT = 120.0
+ARQ_COMPLETED_LIMIT = 1024
+# Kapatılan aktarımlara geç gelen parçalar atılır; yeniden açılan bir akış
+# diskteki kısmi dosyanın üzerine yazmaz.
+CLOSED_TRANSFERS_LIMIT = 1024
+
+class StreamAssembler:
+    def __init__(self, path):
+        # Var olan bir aktarım dosyası hiçbir zaman kesilmez; ad çakışırsa
+        # numaralı yeni bir dosya açılır.
+        root, ext = os.path.splitext(path)
+        for attempt in itertools.count():
+            self.path = path if attempt == 0 else f"{root}.{attempt}{ext}"
+            try:
+                self.file = open(self.path, 'xb')
+                break
+            except FileExistsError:
+                continue
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.next_seq = 0
+        self.last_seq = None
+        self.bytes_written = 0
+        self.chunks_valid = 0
+        self.corrupted_seqs = []
+        self.updated = time.monotonic()
+        self.closed = False
+    
+    def add(self, seq, data, is_valid, is_last):
+        with self.lock:
+            if self.closed:
+                return False
+            self.updated = time.monotonic()
+            if is_valid:
+                self.chunks_valid += 1
+            else:
+                self.corrupted_seqs.append(seq)
+            if is_last:
+                self.last_seq = seq
+            
+            self.pending[seq] = data
+            while self.next_seq in self.pending:
+                chunk = self.pending.pop(self.next_seq)
+                self.file.write(chunk)
+                self.bytes_written += len(chunk)
+                self.next_seq += 1
+            
+            return self.last_seq is not None and self.next_seq > self.last_seq
+    
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.file.close()
+
+def display_transfer(stream_id, assembler, complete=True):
+    lines = [
+        "\n" + "="*60,
+        "       PARÇALI AKTARIM TAMAMLANDI" if complete else "       PARÇALI AKTARIM EKSİK KALDI",
+        "="*60,
+        f"  Akış             : {stream_id:08x}",
+        f"  Dosya            : {assembler.path}",
+        f"  Yazılan Bayt     : {assembler.bytes_written}",
+        f"  Toplam Parça     : {assembler.next_seq}",
+        f"  Doğru Parça      : {assembler.chunks_valid}",
+        f"  Bozuk Parça      : {len(assembler.corrupted_seqs)}",
+    ]
+    if assembler.corrupted_seqs:
+        shown = ', '.join(str(seq) for seq in sorted(assembler.corrupted_seqs)[:20])
+        more = " ..." if len(assembler.corrupted_seqs) > 20 else ""
+        lines.append(f"  Bozuk Parçalar   : {shown}{more}")
+    lines.append("="*60)
+    log_info("\n".join(lines))
 
 class Client2Receiver:
-    def __init__(self, host='localhost', port=5001):
+    def __init__(self, host='localhost', port=5001, output_dir='.', interactive=True, on_result=None,
+                 metrics_port=None, verify_workers=None, verify_batch=32, backlog=5, workers=1, worker=None,
+                 cache_size=0, udp=False):
+        if workers > 1 and on_result is not None:
+            raise ValueError("on_result yalnızca tek süreçli modda kullanılabilir")
         self.host = host
         self.port = port
+        self.output_dir = output_dir
+        self.interactive = interactive
+        self.on_result = on_result
+        self.metrics_port = metrics_port
+        self.verify_workers = verify_workers
+        self.verify_batch = max(1, verify_batch)
+        self.verify_pool = None
+        self.backlog = backlog
+        self.workers = workers
+        self.worker = worker
+        self.worker_group = None
+        self.cache_size = cache_size
+        self.cache = ControlCache(cache_size) if cache_size else None
+        self.ready = threading.Event()
         self.running = True
-        self.packets_received = 0
-        self.packets_corrupted = 0
-        self.packets_valid = 0
+        self.packet_index = itertools.count(1)
+        self.transfers = {}
+        self.transfers_closed = OrderedDict()
+        self.transfers_lock = threading.Lock()
+        self.arq_windows = {}
+        self.arq_completed = OrderedDict()
+        self.arq_lock = threading.Lock()
+        self.udp = udp
+        self.udp_streams = {}
+        self.udp_lock = threading.Lock()
+        
+        self.metrics = Registry()
+        self.packet_counter = self.metrics.counter(
+            'client2_packets_total', "Alınan paketler (durum, yöntem, hata türü)", ('status', 'method', 'error'))
+        self.verify_seconds = self.metrics.histogram(
+            'client2_verify_seconds', "Paket başına doğrulama süresi", ('method',))
+        self.latency_seconds = self.metrics.histogram(
+            'client2_e2e_latency_seconds', "Client 1 gönderiminden doğrulamaya uçtan uca gecikme", ('method',))
+        self.cache_lookups = self.metrics.counter(
+            'client2_cache_lookups_total', "Kontrol değeri önbelleği sorguları", ('result',))
+        self.arq_feedback = self.metrics.counter(
+            'client2_arq_feedback_total', "Gönderilen ARQ geri bildirimleri", ('kind',))
+        self.fec_codewords = self.metrics.counter(
+            'client2_fec_codewords_total', "FEC ile düzeltilen ve düzeltilemeyen kod sözcükleri", ('result',))
+        self.fec_packets = self.metrics.counter(
+            'client2_fec_packets_total', "FEC paketleri (temiz, onarılan, düzeltilemeyen)", ('result',))
+        self.damaged_blocks = self.metrics.counter(
+            'client2_damaged_blocks_total', "Blok ağacıyla tespit edilen hasarlı bloklar")
+        self.udp_dropped = self.metrics.gauge(
+            'client2_udp_dropped_packets', "UDP akışlarında sıra boşluklarından tespit edilen kayıp paketler",
+            function=self.dropped_packets)
+        self.arq_duplicates = self.metrics.counter(
+            'client2_arq_duplicates_total', "Daha önce teslim edilmiş ARQ paketlerinin tekrarları")
+    
+    @property
+    def packets_received(self):
+        return self.packet_counter.total()
+    
+    @property
+    def packets_valid(self):
+        return self.packet_counter.get('valid')
+    
+    @property
+    def packets_corrupted(self):
+        return self.packet_counter.get('corrupted')
     
     def display_header(self):
         print("\n" + "="*60)
@@ -177,41 +610,306 @@ class Client2Receiver:
         print("-"*60)
     
     def display_stats(self):
+        flush_logs()
         print("\n" + "-"*60)
         print("İSTATİSTİKLER:")
         print(f"  Toplam Paket    : {self.packets_received}")
         print(f"  Doğru Paket     : {self.packets_valid}")
         print(f"  Bozuk Paket     : {self.packets_corrupted}")
+        if self.udp:
+            print(f"  Kayıp Paket     : {sum(value for _, value in self.udp_dropped.items())} "
+                  f"(UDP sıra boşlukları, bozuk paketlerden ayrı)")
         if self.packets_received > 0:
             error_rate = (self.packets_corrupted / self.packets_received) * 100
             print(f"  Hata Oranı      : {error_rate:.1f}%")
+        
+        breakdown = {}
+        for (status, method, error), count in self.packet_counter.items():
+            if status == 'invalid':
+                continue
+            for key in (('Yöntem', method), ('Hata Türü', error)):
+                totals = breakdown.setdefault(key, [0, 0])
+                totals[0] += count
+                if status == 'corrupted':
+                    totals[1] += count
+        for group in ('Yöntem', 'Hata Türü'):
+            rows = sorted((name, totals) for (g, name), totals in breakdown.items() if g == group)
+            if rows:
+                print(f"  {group} Bazında:")
+                for name, (total, corrupted) in rows:
+                    print(f"    {name:<26}: {total} paket, {corrupted} bozuk")
+        
+        for label, histogram in (("Doğrulama Süresi", self.verify_seconds),
+                                 ("Uçtan Uca Gecikme", self.latency_seconds)):
+            p50, p99 = histogram.quantile(0.5), histogram.quantile(0.99)
+            if p50 is not None:
+                print(f"  {label:<17}: p50 ≤ {p50 * 1000:g} ms | p99 ≤ {p99 * 1000:g} ms")
+        
+        if self.fec_packets.total():
+            print(f"  FEC             : {self.fec_packets.get('repaired')} paket onarıldı, "
+                  f"{self.fec_packets.get('uncorrectable')} düzeltilemedi "
+                  f"({self.fec_codewords.get('corrected')} sözcük düzeltildi)")
+        
+        if self.damaged_blocks.total():
+            print(f"  Hasarlı Blok    : {self.damaged_blocks.total()}")
+        
+        acks, naks = self.arq_feedback.get('ack'), self.arq_feedback.get('nak')
+        if acks + naks:
+            print(f"  ARQ             : {acks} ACK, {naks} NAK, {self.arq_duplicates.total()} tekrar")
+        
+        hits, misses = self.cache_lookups.get('hit'), self.cache_lookups.get('miss')
+        if hits + misses:
+            print(f"  Önbellek        : {hits} isabet, {misses} ıska "
+                  f"(isabet oranı {hits / (hits + misses) * 100:.1f}%)")
         print("-"*60)
     
+    def record_result(self, result, verify_time):
+        method = result['method']
+        status = 'valid' if result['is_valid'] else 'corrupted'
+        self.packet_counter.inc(status, method, ERROR_LABELS.get(result['error_id'], 'unknown'))
+        self.verify_seconds.observe(verify_time, method)
+        if result['sent_at']:
+            self.latency_seconds.observe(max(0, time.time_ns() - result['sent_at']) / 1e9, method)
+        if result['fec'] is not None:
+            corrected, uncorrectable = result['fec']
+            self.fec_codewords.inc('corrected', amount=corrected)
+            self.fec_codewords.inc('uncorrectable', amount=uncorrectable)
+            self.fec_packets.inc('uncorrectable' if uncorrectable else 'repaired' if corrected else 'clean')
+        if result['damage'] is not None:
+            self.damaged_blocks.inc(amount=result['damage'][1])
+    
+    def track_sequence(self, result):
+        # UDP'de kayıplar akış başına en yüksek sıra numarası ile alınan paket
+        # sayısı arasındaki farktan bulunur; bozuk paketler de alınmış sayılır.
+        with self.udp_lock:
+            stream = self.udp_streams.setdefault(result['stream_id'], [-1, 0])
+            stream[0] = max(stream[0], result['seq'])
+            stream[1] += 1
+    
+    def dropped_packets(self):
+        with self.udp_lock:
+            return sum(max(0, highest + 1 - count) for highest, count in self.udp_streams.values())
+    
+    def process_packet(self, frame, reply=None):
+        start = time.perf_counter()
+        result, error = verify_packet(frame, self.cache)
+        self.apply_result(frame, result, error, time.perf_counter() - start, reply)
+    
+    def arq_accept(self, stream_id, seq):
+        # Seçici tekrar alıcı penceresi: akış başına beklenen ilk numara ve ondan
+        # ileride teslim edilenler tutulur; tekrar gelen kopyalar teslim edilmez.
+        with self.arq_lock:
+            if stream_id in self.arq_completed:
+                return False
+            window = self.arq_windows.get(stream_id)
+            if window is None:
+                window = self.arq_windows[stream_id] = [0, set(), 0.0]
+            window[2] = time.monotonic()
+            if seq < window[0] or seq in window[1]:
+                return False
+            window[1].add(seq)
+            while window[0] in window[1]:
+                window[1].remove(window[0])
+                window[0] += 1
+            return True
+    
+    def arq_finish(self, stream_id):
+        with self.arq_lock:
+            self.arq_windows.pop(stream_id, None)
+            self.arq_completed[stream_id] = True
+            if len(self.arq_completed) > ARQ_COMPLETED_LIMIT:
+                self.arq_completed.popitem(last=False)
+    
+    def expire_idle(self):
+        # Kabul döngülerinden yaklaşık saniyede bir çağrılır.
+        cutoff = time.monotonic() - IDLE_TIMEOUT
+        with self.transfers_lock:
+            expired = [(key, assembler) for key, assembler in self.transfers.items()
+                       if assembler.updated < cutoff]
+            for stream_id, _ in expired:
+                self.close_transfer_locked(stream_id)
+        for stream_id, assembler in expired:
+            self.abandon_transfer(stream_id, assembler)
+        with self.arq_lock:
+            for stream_id in [key for key, window in self.arq_windows.items() if window[2] < cutoff]:
+                del self.arq_windows[stream_id]
+    
+    def close_transfer_locked(self, stream_id):
+        self.transfers.pop(stream_id, None)
+        self.transfers_closed[stream_id] = True
+        if len(self.transfers_closed) > CLOSED_TRANSFERS_LIMIT:
+            self.transfers_closed.popitem(last=False)
+    
+    def abandon_transfer(self, stream_id, assembler):
+        # Gönderen kapanmış ya da son parça kaybolmuş olabilir; dosya tanıtıcısı
+        # serbest bırakılır, o ana kadar yazılan kısım diskte kalır.
+        assembler.close()
+        with self.arq_lock:
+            self.arq_windows.pop(stream_id, None)
+        display_transfer(stream_id, assembler, complete=False)
+    
+    def acknowledge(self, result, reply, index):
+        # Bozuk paket NAK ile hemen yeniden istenir; doğru paket (tekrarı da)
+        # ACK alır ama yalnızca ilk kopyası teslim edilir.
+        is_valid = result['is_valid']
+        kind = 'ack' if is_valid else 'nak'
+        if reply is not None:
+            try:
+                reply(encode_feedback(result['method'], result['stream_id'], result['seq'], is_valid))
+                self.arq_feedback.inc(kind)
+            except OSError as e:
+                log_warning(f"  ✗ Geri bildirim gönderilemedi: {e}")
+        
+        deliver = is_valid and self.arq_accept(result['stream_id'], result['seq'])
+        if is_valid and not deliver:
+            self.arq_duplicates.inc()
+        log_detail(f"\n[{index}] ARQ: akış {result['stream_id']:08x} #{result['seq']} → {kind.upper()}"
+                   f"{'' if deliver or not is_valid else ' (tekrar)'}")
+        return deliver
+    
+    def apply_result(self, frame, result, error, verify_time, reply=None):
+        index = next(self.packet_index)
+        sampled = begin_packet()
+        
+        if error:
+            self.packet_counter.inc('invalid', 'unknown', 'unknown')
+            log_warning(f"\n[{index}] Paket alındı: {frame!r}\n  ✗ Doğrulama hatası: {error}")
+        else:
+            self.record_result(result, verify_time)
+            if self.udp:
+                self.track_sequence(result)
+            if result['cached'] is not None:
+                self.cache_lookups.inc('hit' if result['cached'] else 'miss')
+            
+            if self.on_result:
+                self.on_result(result)
+            
+            if result['flags'] & FLAG_ARQ and not self.acknowledge(result, reply, index):
+                return
+            
+            if result['flags'] & FLAG_CHUNK:
+                self.process_chunk(result, index)
+                return
+            
+            if sampled:
+                log_detail(f"\n[{index}] Paket alındı: "
+                           f"{result['data']}|{result['method']}|{result['received_control']}")
+                display_result(result)
+    
+    def process_chunk(self, result, index):
+        stream_id = result['stream_id']
+        status = "DATA CORRECT" if result['is_valid'] else "DATA CORRUPTED"
+        if result['damage'] is not None:
+            status += f" (bayt {blocktree.format_ranges(result['damage'][0])})"
+        log_detail(f"\n[{index}] Parça alındı: akış {stream_id:08x} #{result['seq']} "
+                   f"({len(result['data'])} bayt, {result['method']}) → {status}")
+        
+        with self.transfers_lock:
+            if stream_id in self.transfers_closed:
+                log_detail(f"  Akış {stream_id:08x} kapatılmış, parça atıldı")
+                return
+            assembler = self.transfers.get(stream_id)
+            if assembler is None:
+                name = f"transfer_{stream_id:08x}.bin"
+                if self.worker is not None:
+                    name = f"transfer_{stream_id:08x}_w{self.worker.worker_id}.bin"
+                path = os.path.join(self.output_dir, name)
+                assembler = self.transfers[stream_id] = StreamAssembler(path)
+        
+        complete = assembler.add(result['seq'], result['data'], result['is_valid'],
+                                 bool(result['flags'] & FLAG_LAST))
+        if complete:
+            with self.transfers_lock:
+                self.close_transfer_locked(stream_id)
+            if result['flags'] & FLAG_ARQ:
+                self.arq_finish(stream_id)
+            assembler.close()
+            display_transfer(stream_id, assembler)
+    
+    def apply_verified(self, pending, reply=None):
+        # Havuzdan dönen sonuçları gönderim sırasıyla uygular; kuyruk sınırlı
+        # olduğundan havuz yetişemezse bağlantı okuması yavaşlar.
+        while True:
+            item = pending.get()
+            if item is None:
+                break
+            frames, future = item
+            try:
+                outcomes, verify_time = future.result()
+            except Exception as e:
+                outcomes, verify_time = [(None, str(e))] * len(frames), 0.0
+            for frame, (result, error) in zip(frames, outcomes):
+                self.apply_result(frame, result, error, verify_time, reply)
+    
+    def start_applier(self, reply=None):
+        if self.verify_pool is None:
+            return None, None
+        pending = queue.Queue(maxsize=2 * self.verify_workers)
+        applier = threading.Thread(target=self.apply_verified, args=(pending, reply), daemon=True)
+        applier.start()
+        return pending, applier
+    
+    def dispatch_frames(self, frames, pending, reply=None):
+        if pending is None:
+            for frame in frames:
+                self.process_packet(frame, reply)
+            return
+        for i in range(0, len(frames), self.verify_batch):
+            batch = frames[i:i + self.verify_batch]
+            pending.put((batch, self.verify_pool.submit(verify_frames, batch)))
+    
     def handle_connection(self, client_socket, address):
+        client_socket.settimeout(1.0)
+        decoder = FrameDecoder()
+        send_lock = threading.Lock()
+        
+        def reply(data):
+            # ARQ geri bildirimleri paketin geldiği Server bağlantısından döner.
+            with send_lock:
+                client_socket.sendall(data)
+        
+        pending, applier = self.start_applier(reply)
         try:
-            packet = client_socket.recv(4096).decode('utf-8')
-            
-            if packet:
-                self.packets_received += 1
-                print(f"\n[{self.packets_received}] Paket alındı: {packet}")
-                
-                result, error = verify_packet(packet)
+            while self.running:
+                try:
+                    frames, more = decoder.receive(client_socket)
+                except socket.timeout:
+                    continue
                 
-                if error:
-                    print(f"  ✗ Doğrulama hatası: {error}")
-                else:
-                    if result['is_valid']:
-                        self.packets_valid += 1
-                    else:
-                        self.packets_corrupted += 1
-                    
-                    display_result(result)
+                self.dispatch_frames(frames, pending, reply)
+                if not more:
+                    break
                 
         except Exception as e:
-            print(f"  ✗ Bağlantı hatası: {e}")
+            log_warning(f"  ✗ Bağlantı hatası: {e}")
         finally:
+            decoder.close()
+            if applier is not None:
+                pending.put(None)
+                applier.join()
             client_socket.close()
     
+    def serve_datagrams(self, server_socket):
+        # UDP modunda bağlantı yoktur: toplanan datagramlardaki çerçeveler tek
+        # thread'de doğrulanır (veya havuza gönderilir); geri bildirim gönderilmez.
+        pending, applier = self.start_applier()
+        try:
+            while self.running:
+                frames = []
+                for datagram, _ in receive_batch(server_socket):
+                    try:
+                        frames.extend(split_datagram(datagram))
+                    except ValueError as e:
+                        self.packet_counter.inc('invalid', 'unknown', 'unknown')
+                        log_warning(f"  ✗ Datagram hatası: {e}")
+                self.dispatch_frames(frames, pending)
+                self.expire_idle()
+                self.worker_tick()
+        finally:
+            if applier is not None:
+                pending.put(None)
+                applier.join()
+    
     def input_handler(self):
         while self.running:
             try:
@@ -225,21 +923,93 @@ class Client2Receiver:
             except EOFError:
                 break
     
+    def worker_tick(self):
+        if self.worker is None:
+            return
+        if self.worker.stopped():
+            self.running = False
+        self.worker.publish(self.metrics, force=not self.running)
+    
+    def start_workers(self):
+        # Pre-fork: işçiler aynı portu SO_REUSEPORT ile dinler; bu süreç
+        # işçilerin istatistiklerini toplayıp gösterir.
+        reserved = reuse_port_socket(self.host, self.port, socket.SOCK_DGRAM if self.udp else socket.SOCK_STREAM)
+        self.port = reserved.getsockname()[1]
+        if self.udp:
+            # Bağlı bir UDP soketi de datagram payı alacağından port hemen bırakılır.
+            reserved.close()
+        
+        self.worker_group = WorkerGroup(self.workers)
+        options = {
+            'host': self.host, 'port': self.port, 'output_dir': self.output_dir, 'backlog': self.backlog,
+            'verify_workers': self.verify_workers, 'verify_batch': self.verify_batch,
+            'cache_size': self.cache_size, 'udp': self.udp,
+        }
+        self.worker_group.start(run_receiver_worker, options, logging_settings())
+        self.ready.set()
+        
+        print(f"✓ Client 2 dinlemede: {self.host}:{self.port} ({self.workers} işçi süreç)")
+        
+        try:
+            while self.running and self.worker_group.alive():
+                self.worker_group.collect(self.metrics)
+        except KeyboardInterrupt:
+            print("\n\nClient 2 kapatılıyor (Ctrl+C)...")
+        finally:
+            self.running = False
+            self.worker_group.stop(self.metrics)
+            reserved.close()
+            self.display_stats()
+            flush_logs()
+            print("Client 2 kapatıldı.")
+    
     def start(self):
-        self.display_header()
+        if self.worker is None:
+            self.display_header()
+        
+        if self.interactive:
+            input_thread = threading.Thread(target=self.input_handler, daemon=True)
+            input_thread.start()
         
-        input_thread = threading.Thread(target=self.input_handler, daemon=True)
-        input_thread.start()
+        if self.metrics_port is not None:
+            metrics_server = start_metrics_server(self.metrics, self.host, self.metrics_port)
+            print(f"Metrikler: http://{self.host}:{metrics_server.server_address[1]}/metrics")
         
-        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        server_socket.bind((self.host, self.port))
-        server_socket.listen(5)
-        server_socket.settimeout(1.0)
+        if self.workers > 1:
+            self.start_workers()
+            return
         
-        print(f"✓ Client 2 dinlemede: {self.host}:{self.port}")
+        if self.verify_workers is not None:
+            self.verify_workers = self.verify_workers or os.cpu_count() or 1
+            # fork, açık soketleri çocuk süreçlere kopyalayıp bağlantıların
+            # kapanmasını engellediğinden havuz temiz süreçlerle başlatılır.
+            self.verify_pool = concurrent.futures.ProcessPoolExecutor(
+                self.verify_workers, mp_context=multiprocessing.get_context('spawn'),
+                initializer=init_verify_worker, initargs=(self.cache_size,))
+            print(f"Doğrulama havuzu: {self.verify_workers} süreç, parti boyutu {self.verify_batch}")
+            if np is None:
+                log_warning(NUMPY_MISSING)
+        
+        if self.udp:
+            server_socket = udp_socket(self.host, self.port, reuse_port=self.worker is not None)
+            server_socket.setblocking(False)
+        elif self.worker is not None:
+            server_socket = reuse_port_socket(self.host, self.port)
+        else:
+            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server_socket.bind((self.host, self.port))
+        if not self.udp:
+            server_socket.listen(self.backlog)
+            server_socket.settimeout(1.0)
+        self.port = server_socket.getsockname()[1]
+        self.ready.set()
+        
+        print(f"✓ Client 2 dinlemede: {self.host}:{self.port}" + (" (UDP)" if self.udp else ""))
         
         try:
+            if self.udp:
+                self.serve_datagrams(server_socket)
             while self.running:
                 try:
                     client_socket, address = server_socket.accept()
@@ -249,16 +1019,60 @@ class Client2Receiver:
                     )
                     client_thread.start()
                 except socket.timeout:
-                    continue
+                    pass
+                self.expire_idle()
+                self.worker_tick()
         except KeyboardInterrupt:
             print("\n\nClient 2 kapatılıyor (Ctrl+C)...")
         finally:
-            self.display_stats()
+            self.running = False
+            if self.verify_pool is not None:
+                self.verify_pool.shutdown()
+            if self.worker is None:
+                self.display_stats()
+            else:
+                self.worker_tick()
+            for stream_id, assembler in list(self.transfers.items()):
+                self.abandon_transfer(stream_id, assembler)
             server_socket.close()
+            flush_logs()
             print("Client 2 kapatıldı.")
 
+def run_receiver_worker(worker, options, logging_options):
+    configure_logging(*logging_options)
+    receiver = Client2Receiver(**options, interactive=False, worker=worker)
+    try:
+        receiver.start()
+    except KeyboardInterrupt:
+        pass
+
 def main():
-    receiver = Client2Receiver(host='localhost', port=5001)
+    parser = argparse.ArgumentParser(description="Client 2 - alıcı + hata kontrolcüsü")
+    parser.add_argument('--output-dir', default='.',
+                        help="Parçalı aktarımların yazılacağı dizin (varsayılan: .)")
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help="Prometheus biçiminde metrik sunulacak yerel port (varsayılan: kapalı)")
+    parser.add_argument('--backlog', type=int, default=5,
+                        help="Dinleme soketi bekleme kuyruğu uzunluğu (varsayılan: 5)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Aynı portu SO_REUSEPORT ile dinleyen işçi süreç sayısı (varsayılan: 1)")
+    parser.add_argument('--verify-pool', type=int, nargs='?', const=0, metavar='N',
+                        help="Doğrulamayı N süreçlik havuzda yap; N verilmezse çekirdek sayısı kadar "
+                             "(varsayılan: kapalı, bağlantı thread'inde)")
+    parser.add_argument('--verify-batch', type=int, default=32, metavar='N',
+                        help="Havuza tek seferde gönderilen en fazla paket sayısı (varsayılan: 32)")
+    parser.add_argument('--cache-size', type=int, default=0, metavar='N',
+                        help="Tekrarlanan yükler için N girdilik kontrol değeri önbelleği (varsayılan: 0, kapalı)")
+    parser.add_argument('--udp', action='store_true',
+                        help="Paketleri TCP yerine UDP datagramlarıyla al (ARQ geri bildirimi yok)")
+    add_logging_arguments(parser)
+    args = parser.parse_args()
+    
+    configure_logging(args.verbosity, args.sample)
+    receiver = Client2Receiver(host='localhost', port=5001, output_dir=args.output_dir,
+                               metrics_port=args.metrics_port, verify_workers=args.verify_pool,
+                               verify_batch=args.verify_batch, backlog=args.backlog, workers=args.workers,
+                               cache_size=args.cache_size, udp=args.udp)
     receiver.start()
 
 if __name__ == "__main__":
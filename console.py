@@ -0,0 +1,109 @@
+import atexit
+import contextvars
+import itertools
+import logging
+import logging.handlers
+import queue
+import threading
+
+VERBOSITY = {
+    'quiet': logging.WARNING,
+    'normal': logging.INFO,
+    'verbose': logging.DEBUG,
+}
+
+logger = logging.getLogger('datacomm')
+logger.propagate = False
+logger.setLevel(logging.DEBUG)
+
+# Paket başına ayrıntı satırları yalnızca örneklenen paketlerde yazılır; bayrak
+# her thread'e ve asyncio görevine ayrı tutulur.
+packet_sampled = contextvars.ContextVar('packet_sampled', default=True)
+
+class PrintHandler(logging.Handler):
+    def emit(self, record):
+        flushed = getattr(record, 'flushed', None)
+        if flushed is not None:
+            flushed.set()
+            return
+        try:
+            print(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+class LogState:
+    def __init__(self):
+        self.queue = None
+        self.listener = None
+        self.verbosity = 'verbose'
+        self.sample_every = 1
+        self.packet_index = itertools.count()
+
+state = LogState()
+logger.addHandler(PrintHandler())
+
+def configure_logging(verbosity='verbose', sample_every=1, queued=True):
+    stop_logging()
+    logger.handlers.clear()
+    logger.setLevel(VERBOSITY[verbosity])
+    state.verbosity = verbosity
+    state.sample_every = max(1, sample_every)
+    
+    if not queued:
+        logger.addHandler(PrintHandler())
+        return
+    
+    # Konsola yazma tek bir arka plan thread'inde yapılır; paket işleyen
+    # thread'ler yalnızca kuyruğa kayıt bırakır.
+    state.queue = queue.Queue()
+    logger.addHandler(logging.handlers.QueueHandler(state.queue))
+    state.listener = logging.handlers.QueueListener(state.queue, PrintHandler())
+    state.listener.start()
+
+def logging_settings():
+    return state.verbosity, state.sample_every
+
+def stop_logging():
+    if state.listener is not None:
+        state.listener.stop()
+        state.listener = None
+        state.queue = None
+
+def flush_logs(timeout=5.0):
+    # Kuyruğa bir işaret bırakıp yazıcı ona ulaşana kadar bekler; yoğun trafikte
+    # sonradan gelen kayıtları beklemeden menü ve istatistikler sırayla basılır.
+    if state.queue is None:
+        return
+    flushed = threading.Event()
+    state.queue.put(logging.makeLogRecord({'flushed': flushed}))
+    flushed.wait(timeout)
+
+def begin_packet(sampled=None):
+    # Paket başka bir thread'e geçtiğinde önceki aşamanın kararı verilerek
+    # aynı paket yeniden sayılmadan örnekleme korunur.
+    if sampled is None:
+        sampled = (logger.isEnabledFor(logging.DEBUG)
+                   and next(state.packet_index) % state.sample_every == 0)
+    packet_sampled.set(sampled)
+    return sampled
+
+def log_detail(message):
+    if packet_sampled.get() and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message)
+
+def log_info(message):
+    logger.info(message)
+
+def log_warning(message):
+    logger.warning(message)
+
+def add_logging_arguments(parser):
+    parser.add_argument('--verbosity', choices=list(VERBOSITY), default='verbose',
+                        help="Konsol ayrıntı düzeyi: quiet yalnızca hatalar, normal bağlantı olayları, "
+                             "verbose paket ayrıntıları (varsayılan: verbose)")
+    parser.add_argument('-q', '--quiet', action='store_const', const='quiet', dest='verbosity',
+                        help="--verbosity quiet kısaltması")
+    parser.add_argument('--sample', type=int, default=1, metavar='N',
+                        help="Paket ayrıntısını her N pakette bir yaz (varsayılan: 1, hepsi)")
+
+atexit.register(stop_logging)
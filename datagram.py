@@ -0,0 +1,70 @@
+import select
+import socket
+
+from protocol import FrameDecoder
+
+# Datagram başına birden çok ikili çerçeve taşınır; çerçeve başlığındaki
+# uzunluklar ayırıcı görevi görür. Varsayılan boyut tek Ethernet MTU'suna sığar.
+DATAGRAM_SIZE = 1400
+MAX_DATAGRAM_SIZE = 65507
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+RECEIVE_BATCH = 64
+
+def udp_socket(host=None, port=None, reuse_port=False):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, SOCKET_BUFFER_SIZE)
+        except OSError:
+            pass
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    if port is not None:
+        sock.bind((host, port))
+    return sock
+
+def split_datagram(datagram, mutable=False):
+    decoder = FrameDecoder(mutable)
+    try:
+        frames = decoder.feed(datagram)
+        decoder.check()
+        if decoder.pending():
+            raise ValueError("Datagram eksik bir çerçeveyle bitti")
+    finally:
+        decoder.close()
+    return frames
+
+def receive_batch(sock, timeout=1.0, limit=RECEIVE_BATCH):
+    # Soket bloklamasız olmalıdır: ilk datagram select ile beklenir, kuyrukta
+    # bekleyenler aynı uyanışta toplanır. Zaman aşımında boş liste döner.
+    readable, _, _ = select.select([sock], [], [], timeout)
+    batch = []
+    while readable and len(batch) < limit:
+        try:
+            batch.append(sock.recvfrom(MAX_DATAGRAM_SIZE))
+        except (BlockingIOError, InterruptedError):
+            break
+    return batch
+
+class DatagramBatcher:
+    def __init__(self, sock, address, size=DATAGRAM_SIZE):
+        self.sock = sock
+        self.address = address
+        self.size = size
+        self.buffer = bytearray()
+        self.datagrams = 0
+    
+    def add(self, frame):
+        if isinstance(frame, list):
+            frame = b''.join(frame)
+        if len(frame) > MAX_DATAGRAM_SIZE:
+            raise ValueError(f"Çerçeve tek datagrama sığmıyor: {len(frame)} bayt")
+        if self.buffer and len(self.buffer) + len(frame) > self.size:
+            self.flush()
+        self.buffer.extend(frame)
+    
+    def flush(self):
+        if self.buffer:
+            self.sock.sendto(self.buffer, self.address)
+            self.buffer.clear()
+            self.datagrams += 1
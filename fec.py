@@ -0,0 +1,66 @@
+# Hamming(8,4) SEC-DED: her yarım bayt (nibble) 8 bitlik bir kod sözcüğüne
+# açılır. Bit sırası (MSB'den): p1 p2 d1 p3 d2 d3 d4 p0; p0 tüm sözcüğün
+# paritesidir. Tek bit hatası düzeltilir, çift bit hatası tespit edilir.
+STATUS_OK = 0
+STATUS_CORRECTED = 1
+STATUS_UNCORRECTABLE = 2
+
+def encode_nibble(nibble):
+    d1, d2, d3, d4 = (nibble >> 3) & 1, (nibble >> 2) & 1, (nibble >> 1) & 1, nibble & 1
+    bits = [d1 ^ d2 ^ d4, d1 ^ d3 ^ d4, d1, d2 ^ d3 ^ d4, d2, d3, d4]
+    word = 0
+    for bit in bits:
+        word = (word << 1) | bit
+    return (word << 1) | (sum(bits) & 1)
+
+def decode_word(word):
+    # Konum 1..7 bitleri MSB'den başlar; sendrom hatalı konumu verir.
+    syndrome = 0
+    for position in range(1, 8):
+        if word >> (8 - position) & 1:
+            syndrome ^= position
+    parity = bin(word).count('1') & 1
+    
+    status = STATUS_OK
+    if parity:
+        status = STATUS_CORRECTED
+        if syndrome:
+            word ^= 1 << (8 - syndrome)
+    elif syndrome:
+        status = STATUS_UNCORRECTABLE
+    
+    nibble = 0
+    for position in (3, 5, 6, 7):
+        nibble = (nibble << 1) | (word >> (8 - position) & 1)
+    return nibble, status
+
+CODEWORDS = [encode_nibble(n) for n in range(16)]
+ENCODE_HIGH = bytes(CODEWORDS[b >> 4] for b in range(256))
+ENCODE_LOW = bytes(CODEWORDS[b & 0x0F] for b in range(256))
+
+DECODED = [decode_word(w) for w in range(256)]
+DECODE_HIGH = bytes(nibble << 4 for nibble, _ in DECODED)
+DECODE_LOW = bytes(nibble for nibble, _ in DECODED)
+DECODE_STATUS = bytes(status for _, status in DECODED)
+
+def encode(data):
+    # Bayt başına iki kod sözcüğü (yüksek ve düşük nibble); kod oranı 1/2.
+    data = bytes(data)
+    encoded = bytearray(2 * len(data))
+    encoded[0::2] = data.translate(ENCODE_HIGH)
+    encoded[1::2] = data.translate(ENCODE_LOW)
+    return bytes(encoded)
+
+def decode(encoded):
+    # (veri, düzeltilen sözcük, düzeltilemeyen sözcük) döner. Silme/ekleme ile
+    # tek sayıya düşen uzunlukta artan bayt atılıp düzeltilemeyen sayılır.
+    encoded = bytes(encoded)
+    odd = len(encoded) % 2
+    if odd:
+        encoded = encoded[:-1]
+    
+    statuses = encoded.translate(DECODE_STATUS)
+    high = encoded[0::2].translate(DECODE_HIGH)
+    low = encoded[1::2].translate(DECODE_LOW)
+    data = (int.from_bytes(high, 'big') | int.from_bytes(low, 'big')).to_bytes(len(high), 'big')
+    return data, statuses.count(STATUS_CORRECTED), statuses.count(STATUS_UNCORRECTABLE) + odd
@@ -0,0 +1,225 @@
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+def format_labels(names, values):
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Counter:
+    kind = 'counter'
+    
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.lock = threading.Lock()
+        self.values = {}
+    
+    def inc(self, *label_values, amount=1):
+        with self.lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+    
+    def get(self, *label_values):
+        with self.lock:
+            if len(label_values) == len(self.labels):
+                return self.values.get(label_values, 0)
+            return sum(value for key, value in self.values.items()
+                       if key[:len(label_values)] == label_values)
+    
+    def total(self):
+        with self.lock:
+            return sum(self.values.values())
+    
+    def items(self):
+        with self.lock:
+            return sorted(self.values.items())
+    
+    def samples(self):
+        for key, value in self.items():
+            yield self.name, format_labels(self.labels, key), value
+    
+    def snapshot(self):
+        return dict(self.items())
+    
+    def load(self, snapshots):
+        values = {}
+        for snapshot in snapshots:
+            for key, value in snapshot.items():
+                values[key] = values.get(key, 0) + value
+        with self.lock:
+            self.values = values
+
+class Gauge(Counter):
+    kind = 'gauge'
+    
+    def __init__(self, name, help_text, labels=(), function=None):
+        super().__init__(name, help_text, labels)
+        self.function = function
+    
+    def set(self, value, *label_values):
+        with self.lock:
+            self.values[label_values] = value
+    
+    def dec(self, *label_values, amount=1):
+        self.inc(*label_values, amount=-amount)
+    
+    def items(self):
+        if self.function is not None:
+            value = self.function()
+            if isinstance(value, dict):
+                return sorted(value.items())
+            return [((), value)]
+        return super().items()
+    
+    def load(self, snapshots):
+        # Toplanan değerler yerel fonksiyonun yerini alır.
+        self.function = None
+        super().load(snapshots)
+
+class Histogram:
+    kind = 'histogram'
+    
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+        self.series = {}
+    
+    def observe(self, value, *label_values):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            series = self.series.get(label_values)
+            if series is None:
+                series = self.series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+    
+    def count(self, *label_values):
+        with self.lock:
+            return sum(series[2] for key, series in self.series.items()
+                       if key[:len(label_values)] == label_values)
+    
+    def quantile(self, q, *label_values):
+        with self.lock:
+            counts = [0] * (len(self.buckets) + 1)
+            for key, series in self.series.items():
+                if key[:len(label_values)] == label_values:
+                    counts = [a + b for a, b in zip(counts, series[0])]
+        total = sum(counts)
+        if not total:
+            return None
+        
+        rank = q * total
+        running = 0
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            running += count
+            if running >= rank:
+                return bound
+        return float('inf')
+    
+    def snapshot(self):
+        with self.lock:
+            return {key: (list(s[0]), s[1], s[2]) for key, s in self.series.items()}
+    
+    def load(self, snapshots):
+        series = {}
+        for snapshot in snapshots:
+            for key, (counts, total, count) in snapshot.items():
+                merged = series.get(key)
+                if merged is None:
+                    merged = series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                merged[0] = [a + b for a, b in zip(merged[0], counts)]
+                merged[1] += total
+                merged[2] += count
+        with self.lock:
+            self.series = series
+    
+    def samples(self):
+        with self.lock:
+            series = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self.series.items())
+        for key, (counts, total, count) in series:
+            running = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                running += bucket_count
+                labels = format_labels(self.labels + ('le',), key + (format_value(bound),))
+                yield f'{self.name}_bucket', labels, running
+            labels = format_labels(self.labels, key)
+            yield f'{self.name}_sum', labels, total
+            yield f'{self.name}_count', labels, count
+
+class Registry:
+    def __init__(self):
+        self.metrics = {}
+    
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+    
+    def counter(self, name, help_text, labels=()):
+        return self.register(Counter(name, help_text, labels))
+    
+    def gauge(self, name, help_text, labels=(), function=None):
+        return self.register(Gauge(name, help_text, labels, function))
+    
+    def histogram(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, help_text, labels, buckets))
+    
+    def snapshot(self):
+        return {name: metric.snapshot() for name, metric in self.metrics.items()}
+    
+    def load(self, snapshots):
+        # Çok süreçli modda her işçinin son görüntüsü toplanarak yüklenir.
+        snapshots = list(snapshots)
+        for name, metric in self.metrics.items():
+            metric.load([snapshot[name] for snapshot in snapshots if name in snapshot])
+    
+    def render(self):
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f'# HELP {metric.name} {metric.help_text}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for name, labels, value in metric.samples():
+                lines.append(f'{name}{labels} {format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        
+        body = self.server.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+def start_metrics_server(registry, host='localhost', port=0):
+    httpd = ThreadingHTTPServer((host, port), MetricsHandler)
+    httpd.daemon_threads = True
+    httpd.registry = registry
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
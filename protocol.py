@@ -0,0 +1,316 @@
+import struct
+import threading
+from collections import namedtuple
+
+FRAME_VERSION = 3
+HEADER = struct.Struct('!BBBBIIQII')
+LEGACY_DELIMITER = b'\n'
+MAX_PAYLOAD_SIZE = 64 * 1024 * 1024
+# En uzun kontrol bilgisi HAMMING'dir (bayt başına 1,5 hane); BLOCKTREE'nin
+# sabit kök kısmı için pay bırakılır.
+MAX_CONTROL_DIGITS_PER_BYTE = 2
+MAX_CONTROL_DIGITS_BASE = 64
+MAX_FRAME_SIZE = (HEADER.size + (MAX_CONTROL_DIGITS_PER_BYTE * MAX_PAYLOAD_SIZE + MAX_CONTROL_DIGITS_BASE + 1) // 2
+                  + MAX_PAYLOAD_SIZE)
+# Havuzdaki okuma tamponları 64 KiB'lik dosya parçalarını başlıklarıyla birlikte alır.
+RECEIVE_BUFFER_SIZE = 256 * 1024
+RECEIVE_POOL_LIMIT = 64
+MIN_RECEIVE_SPACE = 16 * 1024
+
+METHOD_IDS = {
+    'PARITY': 1,
+    '2DPARITY': 2,
+    'CRC16': 3,
+    'HAMMING': 4,
+    'CHECKSUM': 5,
+    'FEC': 6,
+    'BLOCKTREE': 7,
+    'CRC32': 8,
+    'CRC32C': 9,
+    'ADLER32': 10,
+    'FLETCHER16': 11,
+}
+METHOD_NAMES = {method_id: name for name, method_id in METHOD_IDS.items()}
+
+ERROR_LABELS = {
+    0: 'unknown',
+    1: 'bit_flip',
+    2: 'character_substitution',
+    3: 'character_deletion',
+    4: 'random_character_insertion',
+    5: 'burst_error',
+    6: 'none',
+    7: 'bit_error_rate',
+    8: 'gilbert_elliott',
+}
+
+FLAG_BINARY = 0x01
+FLAG_CHUNK = 0x02
+FLAG_LAST = 0x04
+FLAG_ARQ = 0x08
+FLAG_ACK = 0x10
+FLAG_NAK = 0x20
+# FEC gibi yükü ikili kodlayan yöntemlerde, çözülen verinin metin olduğunu belirtir.
+FLAG_TEXT = 0x40
+FLAGS_OFFSET = 2
+
+Header = namedtuple('Header', ['version', 'method_id', 'flags', 'error_id', 'stream_id', 'seq', 'sent_at',
+                               'digits', 'payload_len'])
+
+Packet = namedtuple('Packet', ['data', 'method', 'control_info', 'stream_id', 'seq', 'flags',
+                               'error_id', 'sent_at'],
+                    defaults=[0, 0, 0, 0, 0])
+
+def is_frame_version(byte):
+    # Eski metin satırları sekme veya boş satırla başlayabilir; yalnızca 0x09
+    # altındaki baytlar çerçeve sürümü sayılır, desteklenmeyen sürümler
+    # metin olarak değil hata olarak raporlanır.
+    return byte < 0x09
+
+def is_binary_frame(frame):
+    return len(frame) > 0 and frame[0] == FRAME_VERSION
+
+def frame_flags(frame):
+    # Başlığı çözmeden bayrak baytına bakar; eski metin satırları için 0.
+    if is_binary_frame(frame) and len(frame) > FLAGS_OFFSET:
+        return frame[FLAGS_OFFSET]
+    return 0
+
+def encode_feedback(method, stream_id, seq, ack):
+    return encode_packet('', method, '', stream_id, seq, flags=FLAG_ACK if ack else FLAG_NAK)
+
+def describe_data(data):
+    if isinstance(data, str):
+        return data
+    return f"<{len(data)} bayt>"
+
+def format_packet(packet):
+    return f"{describe_data(packet.data)}|{packet.method}|{packet.control_info}"
+
+def encode_control(control_info):
+    digits = len(control_info)
+    return digits, bytes.fromhex(control_info.rjust(digits + digits % 2, '0'))
+
+def decode_control(raw, digits):
+    return raw.hex().upper()[len(raw) * 2 - digits:]
+
+def encode_packet(data, method, control_info, stream_id=0, seq=0, flags=0, error_id=0, sent_at=0,
+                  legacy=False):
+    if legacy:
+        return f"{data}|{method}|{control_info}".encode('utf-8') + LEGACY_DELIMITER
+    
+    method_id = METHOD_IDS.get(method.upper())
+    if method_id is None:
+        raise ValueError(f"Bilinmeyen yöntem: {method}")
+    
+    if isinstance(data, str):
+        payload = data.encode('utf-8')
+        flags &= ~FLAG_BINARY
+    else:
+        payload = data
+        flags |= FLAG_BINARY
+    
+    digits, control = encode_control(control_info)
+    header = HEADER.pack(FRAME_VERSION, method_id, flags, error_id, stream_id, seq, sent_at,
+                         digits, len(payload))
+    return b''.join((header, control, payload))
+
+def unpack_header(frame):
+    if len(frame) < HEADER.size:
+        raise ValueError("Eksik çerçeve başlığı")
+    
+    header = Header(*HEADER.unpack_from(frame))
+    if header.version != FRAME_VERSION:
+        raise ValueError(f"Desteklenmeyen çerçeve sürümü: {header.version}")
+    if header.method_id not in METHOD_NAMES:
+        raise ValueError(f"Bilinmeyen yöntem kimliği: {header.method_id}")
+    
+    control_end = HEADER.size + (header.digits + 1) // 2
+    if len(frame) != control_end + header.payload_len:
+        raise ValueError("Çerçeve uzunluğu tutarsız")
+    return header, control_end
+
+def decode_packet(frame):
+    if isinstance(frame, str):
+        frame = frame.encode('utf-8')
+    
+    if not frame or not is_frame_version(frame[0]):
+        parts = bytes(frame).decode('utf-8').rsplit('|', 2)
+        if len(parts) != 3:
+            raise ValueError("Geçersiz paket formatı")
+        return Packet(*parts)
+    
+    header, control_end = unpack_header(frame)
+    control_info = decode_control(frame[HEADER.size:control_end], header.digits)
+    data = bytes(frame[control_end:])
+    if not header.flags & FLAG_BINARY:
+        # Yolda bozulan metin geçersiz UTF-8 olabilir; yerine konan karakterler
+        # kontrol değerini değiştirdiğinden hata yine tespit edilir.
+        data = data.decode('utf-8', errors='replace')
+    return Packet(data, METHOD_NAMES[header.method_id], control_info, header.stream_id, header.seq,
+                  header.flags, header.error_id, header.sent_at)
+
+def frame_length(buffer, offset=0):
+    if buffer[offset] != FRAME_VERSION:
+        raise ValueError(f"Desteklenmeyen çerçeve sürümü: {buffer[offset]}")
+    if len(buffer) - offset < HEADER.size:
+        return None
+    
+    _, _, _, _, _, _, _, digits, payload_len = HEADER.unpack_from(buffer, offset)
+    if payload_len > MAX_PAYLOAD_SIZE:
+        raise ValueError(f"Çerçeve çok büyük: {payload_len} bayt")
+    if digits > MAX_CONTROL_DIGITS_PER_BYTE * payload_len + MAX_CONTROL_DIGITS_BASE:
+        raise ValueError(f"Kontrol bilgisi çok uzun: {digits} hane")
+    
+    length = HEADER.size + (digits + 1) // 2 + payload_len
+    if length > MAX_FRAME_SIZE:
+        raise ValueError(f"Çerçeve çok büyük: {length} bayt")
+    return length
+
+class BufferPool:
+    # Bağlantılar okumayı bu tamponlara recv_into ile yapar; yarım çerçeve
+    # beklemeyen decoder tamponunu hemen geri verir, böylece boştaki
+    # bağlantılar bellek tutmaz.
+    def __init__(self, size=RECEIVE_BUFFER_SIZE, limit=RECEIVE_POOL_LIMIT):
+        self.size = size
+        self.limit = limit
+        self.free = []
+        self.lock = threading.Lock()
+        self.allocated = 0
+    
+    def acquire(self):
+        with self.lock:
+            if self.free:
+                return self.free.pop()
+            self.allocated += 1
+        return bytearray(self.size)
+    
+    def release(self, buffer):
+        # Büyük çerçeve için büyütülmüş tamponlar havuza dönmez.
+        with self.lock:
+            if len(buffer) == self.size and len(self.free) < self.limit:
+                self.free.append(buffer)
+
+RECEIVE_POOL = BufferPool()
+
+class FrameDecoder:
+    def __init__(self, mutable=False, pool=RECEIVE_POOL):
+        # mutable=True çerçeveleri bytearray olarak verir; yerinde bozma yapan
+        # aktarım yolu ek kopya almadan üzerinde çalışır.
+        self.mutable = mutable
+        self.pool = pool
+        self.buffer = None
+        self.start = self.end = 0
+        self.needed = 0
+        self.error = None
+    
+    def check(self):
+        # parse bozuk bir çerçeveye rastladığında önceki çerçeveleri döndürür;
+        # hata bir sonraki çağrıda yükseltilir.
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+    
+    def pending(self):
+        return self.end - self.start
+    
+    def reserve(self, size):
+        # Bekleyen baytların ardında en az size bayt (yarım çerçevenin
+        # tamamı biliniyorsa o kadar) boş yer açar.
+        if self.buffer is None:
+            self.buffer = self.pool.acquire()
+        pending = self.end - self.start
+        want = max(self.needed, pending + size)
+        if self.start + want <= len(self.buffer):
+            return
+        if want <= len(self.buffer):
+            with memoryview(self.buffer) as view:
+                view[:pending] = view[self.start:self.end]
+        else:
+            grown = bytearray(want)
+            grown[:pending] = memoryview(self.buffer)[self.start:self.end]
+            self.pool.release(self.buffer)
+            self.buffer = grown
+        self.start, self.end = 0, pending
+    
+    def feed(self, data):
+        self.check()
+        self.reserve(len(data))
+        self.buffer[self.end:self.end + len(data)] = data
+        self.end += len(data)
+        return self.parse()
+    
+    def receive(self, sock):
+        # Soketten tampona doğrudan okur; (çerçeveler, bağlantı açık mı) döner.
+        # Karşı taraf kapattıysa kalan baytlar flush ile çözülür.
+        self.check()
+        self.reserve(MIN_RECEIVE_SPACE)
+        try:
+            with memoryview(self.buffer) as view:
+                count = sock.recv_into(view[self.end:])
+        except BaseException:
+            # Zaman aşımında bekleyen bağlantı tamponu tutmaz; yarım çerçeve
+            # varsa tampon korunur.
+            if self.start == self.end:
+                self.close()
+            raise
+        if not count:
+            return self.flush(), False
+        self.end += count
+        return self.parse(), True
+    
+    def parse(self):
+        # Sınırlar tampona bakan memoryview üzerinde bulunur; her çerçeve
+        # tampondan bir kez kopyalanır çünkü kuyruklarda okumadan uzun yaşar.
+        frames = []
+        copy = bytearray if self.mutable else bytes
+        buffer, start, end = self.buffer, self.start, self.end
+        with memoryview(buffer)[:end] as view:
+            while start < end:
+                if is_frame_version(buffer[start]):
+                    try:
+                        length = frame_length(view, start)
+                    except ValueError as e:
+                        # Çerçeve sınırı kaybolduğundan tampondaki kalan
+                        # baytlar atlanır.
+                        self.error = e
+                        start = end
+                        break
+                    if length is None or end - start < length:
+                        self.needed = length or HEADER.size
+                        break
+                    frames.append(copy(view[start:start + length]))
+                else:
+                    self.needed = 0
+                    delimiter = buffer.find(LEGACY_DELIMITER, start, end)
+                    if delimiter == -1:
+                        break
+                    length = delimiter + 1 - start
+                    if length > 1:
+                        frames.append(copy(view[start:delimiter]))
+                start += length
+                self.needed = 0
+        self.start = start
+        
+        if self.start == self.end:
+            self.close()
+        return frames
+    
+    def flush(self):
+        self.check()
+        frame = b''
+        if self.buffer is not None:
+            frame = bytes(memoryview(self.buffer)[self.start:self.end])
+        self.close()
+        
+        if not frame:
+            return []
+        if is_frame_version(frame[0]):
+            raise ValueError("Bağlantı eksik bir çerçeveyle kapandı")
+        return [frame]
+    
+    def close(self):
+        if self.buffer is not None:
+            self.pool.release(self.buffer)
+            self.buffer = None
+        self.start = self.end = self.needed = 0
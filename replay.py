@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+
+import argparse
+import socket
+import threading
+import time
+
+from capture import KIND_CORRUPTED, KIND_NAMES, KIND_RECEIVED, CaptureLog
+from protocol import ERROR_LABELS
+from server import send_buffers
+
+REPLAY_BATCH_SIZE = 64
+REPLAY_BATCH_BYTES = 256 * 1024
+
+# Server'a Client 1'den alınan paketler, Client 2'ye server'ın bozup ilettiği
+# paketler yeniden gönderilir.
+TARGETS = {
+    'server': (KIND_RECEIVED, 5000),
+    'receiver': (KIND_CORRUPTED, 5001),
+}
+
+def summarize(path):
+    counts = {}
+    errors = {}
+    first = last = None
+    with CaptureLog(path) as log:
+        for record in log:
+            counts[record.kind] = counts.get(record.kind, 0) + 1
+            if record.kind == KIND_CORRUPTED:
+                label = ERROR_LABELS.get(record.error_id, 'unknown')
+                errors[label] = errors.get(label, 0) + 1
+            first = record.timestamp if first is None else first
+            last = record.timestamp
+    duration = (last - first) / 1e9 if first is not None else 0.0
+    return counts, errors, duration
+
+def drain(sock, stats):
+    # Server yanıtları ve ARQ geri bildirimleri okunmazsa karşı taraf yazarken
+    # tıkanır; içerikleri yalnızca sayılır.
+    while True:
+        try:
+            chunk = sock.recv(65536)
+        except OSError:
+            break
+        if not chunk:
+            break
+        stats['reply_bytes'] += len(chunk)
+
+def replay(path, target='server', host='localhost', port=None, speed=1.0, limit=None):
+    # speed, kayıttaki aralıkların kaç kat hızlı oynatılacağıdır; 0 beklemeden,
+    # çerçeveleri eşlenmiş dosyadan kopyalamadan toplu gönderir.
+    kind, default_port = TARGETS[target]
+    stats = {'packets': 0, 'bytes': 0, 'reply_bytes': 0}
+    
+    with CaptureLog(path) as log, socket.create_connection((host, port or default_port)) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        reader = threading.Thread(target=drain, args=(sock, stats), daemon=True)
+        reader.start()
+        
+        start = time.perf_counter()
+        first = None
+        batch = []
+        batch_bytes = 0
+        for record in log:
+            if record.kind != kind:
+                continue
+            if limit is not None and stats['packets'] >= limit:
+                break
+            
+            if speed:
+                first = record.timestamp if first is None else first
+                delay = (record.timestamp - first) / 1e9 / speed - (time.perf_counter() - start)
+                if delay > 0:
+                    if batch:
+                        send_buffers(sock, batch)
+                        batch.clear()
+                        batch_bytes = 0
+                    time.sleep(delay)
+            
+            batch.append(record.frame)
+            batch_bytes += len(record.frame)
+            stats['packets'] += 1
+            stats['bytes'] += len(record.frame)
+            if len(batch) >= REPLAY_BATCH_SIZE or batch_bytes >= REPLAY_BATCH_BYTES:
+                send_buffers(sock, batch)
+                batch.clear()
+                batch_bytes = 0
+        if batch:
+            send_buffers(sock, batch)
+            batch.clear()
+        
+        stats['send_time'] = time.perf_counter() - start
+        sock.shutdown(socket.SHUT_WR)
+        reader.join()
+        stats['total_time'] = time.perf_counter() - start
+    
+    return stats
+
+def display_summary(path, counts, errors, duration):
+    print("\n" + "="*60)
+    print("       YAKALAMA DOSYASI")
+    print("="*60)
+    print(f"  Dosya            : {path}")
+    for kind, name in KIND_NAMES.items():
+        print(f"  {name:<17}: {counts.get(kind, 0)} paket")
+    for label, count in sorted(errors.items()):
+        print(f"    {label:<26}: {count}")
+    print(f"  Kayıt Süresi     : {duration:.3f} s")
+    print("-"*60)
+
+def display_replay(stats, target, speed):
+    elapsed = max(stats['total_time'], 1e-9)
+    pacing = "azami hız" if not speed else f"özgün aralıklar × {speed:g}"
+    print("\n" + "-"*60)
+    print(f"YENİDEN OYNATMA SONUCU ({target}, {pacing}):")
+    print(f"  Gönderilen Paket : {stats['packets']}")
+    print(f"  Gönderilen Bayt  : {stats['bytes']}")
+    print(f"  Alınan Yanıt     : {stats['reply_bytes']} bayt")
+    print(f"  Gönderim Süresi  : {stats['send_time']:.3f} s")
+    print(f"  Toplam Süre      : {stats['total_time']:.3f} s")
+    print(f"  Paket Hızı       : {stats['packets'] / elapsed:.1f} paket/s")
+    print(f"  Veri Hızı        : {stats['bytes'] / elapsed / 1e6:.3f} MB/s")
+    print("-"*60)
+
+def main():
+    parser = argparse.ArgumentParser(description="server.py --capture ile kaydedilen trafiği yeniden oynat")
+    parser.add_argument('capture', metavar='DOSYA', help="Yakalama dosyası")
+    parser.add_argument('--target', choices=sorted(TARGETS), default='server',
+                        help="server: alınan paketleri Server'a, receiver: bozulmuş paketleri doğrudan "
+                             "Client 2'ye gönder (varsayılan: server)")
+    parser.add_argument('--host', default='localhost', help="Hedef adres (varsayılan: localhost)")
+    parser.add_argument('--port', type=int, help="Hedef port (varsayılan: server 5000, receiver 5001)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Kayıttaki aralıkları bu kat hızlı oynat; 0 azami hız (varsayılan: 1)")
+    parser.add_argument('--max-speed', action='store_const', const=0.0, dest='speed',
+                        help="Beklemeden azami hızda oynat (--speed 0)")
+    parser.add_argument('--limit', type=int, metavar='N', help="En fazla N paket gönder")
+    parser.add_argument('--info', action='store_true', help="Yalnızca dosya özetini göster")
+    args = parser.parse_args()
+    
+    try:
+        display_summary(args.capture, *summarize(args.capture))
+        if args.info:
+            return
+        stats = replay(args.capture, args.target, args.host, args.port, args.speed, args.limit)
+        display_replay(stats, args.target, args.speed)
+    except ConnectionRefusedError:
+        print(f"\n✗ Hata: Hedefe bağlanılamadı! {args.target} çalışıyor mu?")
+    except (OSError, ValueError) as e:
+        print(f"\n✗ Hata: {e}")
+
+if __name__ == "__main__":
+    main()
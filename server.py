@@ -1,18 +1,40 @@
 #!/usr/bin/env python3
 
+import argparse
+import asyncio
+import itertools
+import math
+import queue
+import select
 import socket
 import threading
 import random
+import selectors
 import sys
+import time
+from collections import OrderedDict, deque
 
-def bit_flip(data):
+from capture import KIND_CORRUPTED, KIND_RECEIVED, CaptureWriter, worker_path
+from console import (
+    add_logging_arguments, begin_packet, configure_logging, flush_logs, log_detail, log_info, log_warning,
+    logging_settings, packet_sampled
+)
+from datagram import DATAGRAM_SIZE, DatagramBatcher, receive_batch, split_datagram, udp_socket
+from metrics import Registry, start_metrics_server
+from protocol import (
+    ERROR_LABELS, FLAG_ACK, FLAG_ARQ, FLAG_CHUNK, HEADER, METHOD_NAMES, FrameDecoder, decode_control,
+    decode_packet, describe_data, encode_packet, format_packet, frame_flags, is_binary_frame, unpack_header
+)
+from workers import WorkerGroup, reuse_port_socket
+
+def bit_flip(data, rng=random):
     if not data:
         return data
     
-    char_index = random.randint(0, len(data) - 1)
+    char_index = rng.randint(0, len(data) - 1)
     char = data[char_index]
     
-    bit_index = random.randint(0, 7)
+    bit_index = rng.randint(0, 7)
     ascii_val = ord(char)
     corrupted_val = ascii_val ^ (1 << bit_index)
     
@@ -22,62 +44,62 @@ def bit_flip(data):
     corrupted_char = chr(corrupted_val)
     
     result = data[:char_index] + corrupted_char + data[char_index+1:]
-    print(f"    [Bit Flip] Karakter '{char}' → '{corrupted_char}' (pozisyon {char_index})")
+    log_detail(f"    [Bit Flip] Karakter '{char}' → '{corrupted_char}' (pozisyon {char_index})")
     return result
 
-def character_substitution(data):
+def character_substitution(data, rng=random):
     if not data:
         return data
     
-    char_index = random.randint(0, len(data) - 1)
+    char_index = rng.randint(0, len(data) - 1)
     original_char = data[char_index]
     
     new_char = original_char
     while new_char == original_char:
-        new_char = chr(random.randint(65, 90))
+        new_char = chr(rng.randint(65, 90))
     
     result = data[:char_index] + new_char + data[char_index+1:]
-    print(f"    [Character Substitution] '{original_char}' → '{new_char}' (pozisyon {char_index})")
+    log_detail(f"    [Character Substitution] '{original_char}' → '{new_char}' (pozisyon {char_index})")
     return result
 
-def character_deletion(data):
+def character_deletion(data, rng=random):
     if len(data) <= 1:
         return data
     
-    char_index = random.randint(0, len(data) - 1)
+    char_index = rng.randint(0, len(data) - 1)
     deleted_char = data[char_index]
     
     result = data[:char_index] + data[char_index+1:]
-    print(f"    [Character Deletion] '{deleted_char}' silindi (pozisyon {char_index})")
+    log_detail(f"    [Character Deletion] '{deleted_char}' silindi (pozisyon {char_index})")
     return result
 
-def random_character_insertion(data):
+def random_character_insertion(data, rng=random):
     if not data:
         return data
     
-    insert_index = random.randint(0, len(data))
-    new_char = chr(random.randint(97, 122))
+    insert_index = rng.randint(0, len(data))
+    new_char = chr(rng.randint(97, 122))
     
     result = data[:insert_index] + new_char + data[insert_index:]
-    print(f"    [Character Insertion] '{new_char}' eklendi (pozisyon {insert_index})")
+    log_detail(f"    [Character Insertion] '{new_char}' eklendi (pozisyon {insert_index})")
     return result
 
-def burst_error(data):
+def burst_error(data, rng=random):
     if len(data) < 3:
-        return bit_flip(data)
+        return bit_flip(data, rng)
     
-    burst_length = random.randint(2, min(4, len(data)))
-    start_index = random.randint(0, len(data) - burst_length)
+    burst_length = rng.randint(2, min(4, len(data)))
+    start_index = rng.randint(0, len(data) - burst_length)
     
     result = list(data)
     original_burst = data[start_index:start_index + burst_length]
     
     for i in range(start_index, start_index + burst_length):
-        new_char = chr(random.randint(65, 90))
+        new_char = chr(rng.randint(65, 90))
         result[i] = new_char
     
     corrupted_burst = ''.join(result[start_index:start_index + burst_length])
-    print(f"    [Burst Error] '{original_burst}' → '{corrupted_burst}' (pozisyon {start_index}-{start_index + burst_length - 1})")
+    log_detail(f"    [Burst Error] '{original_burst}' → '{corrupted_burst}' (pozisyon {start_index}-{start_index + burst_length - 1})")
     return ''.join(result)
 
 ERROR_METHODS = {
@@ -86,18 +108,492 @@ ERROR_METHODS = {
     '3': ('Character Deletion', character_deletion),
     '4': ('Random Character Insertion', random_character_insertion),
     '5': ('Burst Error', burst_error),
-    '6': ('No Corruption', lambda x: x),
+    '6': ('No Corruption', lambda x, rng=random: x),
 }
 
+# Aynı hataların bayt düzeyindeki karşılıkları: yük yerinde değiştirilir ve
+# gönderilecek parçaların listesi döner. Silme ve ekleme yükü kopyalamaz,
+# yalnızca parçaları böler.
+def bit_flip_in_place(payload, rng=random):
+    if not payload:
+        return [payload]
+    
+    index = rng.randint(0, len(payload) - 1)
+    original = payload[index]
+    payload[index] = original ^ (1 << rng.randint(0, 7))
+    log_detail(f"    [Bit Flip] Bayt 0x{original:02X} → 0x{payload[index]:02X} (pozisyon {index})")
+    return [payload]
+
+def byte_substitution_in_place(payload, rng=random):
+    if not payload:
+        return [payload]
+    
+    index = rng.randint(0, len(payload) - 1)
+    original = payload[index]
+    new_byte = original
+    while new_byte == original:
+        new_byte = rng.randint(65, 90)
+    payload[index] = new_byte
+    log_detail(f"    [Character Substitution] 0x{original:02X} → 0x{new_byte:02X} (pozisyon {index})")
+    return [payload]
+
+def byte_deletion_in_place(payload, rng=random):
+    if len(payload) <= 1:
+        return [payload]
+    
+    index = rng.randint(0, len(payload) - 1)
+    log_detail(f"    [Character Deletion] 0x{payload[index]:02X} silindi (pozisyon {index})")
+    return [payload[:index], payload[index + 1:]]
+
+def byte_insertion_in_place(payload, rng=random):
+    if not payload:
+        return [payload]
+    
+    index = rng.randint(0, len(payload))
+    new_byte = rng.randint(97, 122)
+    log_detail(f"    [Character Insertion] 0x{new_byte:02X} eklendi (pozisyon {index})")
+    return [payload[:index], bytes((new_byte,)), payload[index:]]
+
+def burst_error_in_place(payload, rng=random):
+    if len(payload) < 3:
+        return bit_flip_in_place(payload, rng)
+    
+    burst_length = rng.randint(2, min(4, len(payload)))
+    start_index = rng.randint(0, len(payload) - burst_length)
+    for i in range(start_index, start_index + burst_length):
+        payload[i] = rng.randint(65, 90)
+    log_detail(f"    [Burst Error] {burst_length} bayt değişti (pozisyon {start_index}-{start_index + burst_length - 1})")
+    return [payload]
+
+IN_PLACE_ERROR_METHODS = {
+    '1': bit_flip_in_place,
+    '2': byte_substitution_in_place,
+    '3': byte_deletion_in_place,
+    '4': byte_insertion_in_place,
+    '5': burst_error_in_place,
+    '6': lambda payload, rng=random: [payload],
+}
+
+CORRUPTION_MODELS = {
+    'single': 'Paket başına tek hata (menüden seçilen yöntem)',
+    'ber': 'Bağımsız bit hataları (sabit bit hata oranı)',
+    'gilbert': 'Gilbert-Elliott patlama modeli (iyi/kötü kanal durumları)',
+}
+CORRUPTION_ERROR_IDS = {'ber': 7, 'gilbert': 8}
+
+def geometric(rng, p):
+    # Bir sonraki olaya kadar geçen deneme sayısı (>= 1); bitleri tek tek
+    # dolaşmak yerine hatalar arasındaki boşluk doğrudan örneklenir.
+    if p >= 1.0:
+        return 1
+    if p <= 0.0:
+        return sys.maxsize
+    # log1p, 1e-16'dan küçük olasılıklarda log(1 - p)'nin 0'a yuvarlanmasını önler.
+    return min(int(math.log1p(-rng.random()) / math.log1p(-p)) + 1, sys.maxsize)
+
+def flip_bits(buffer, start, end, ber, rng):
+    flipped = 0
+    if ber <= 0.0:
+        return flipped
+    
+    position = start + geometric(rng, ber) - 1
+    while position < end:
+        buffer[position >> 3] ^= 0x80 >> (position & 7)
+        flipped += 1
+        position += geometric(rng, ber)
+    return flipped
+
+class CorruptionEngine:
+    def __init__(self, model='single', ber=1e-4, p_good_bad=1e-4, p_bad_good=1e-2,
+                 ber_good=0.0, ber_bad=0.1, seed=None, worker=0):
+        if model not in CORRUPTION_MODELS:
+            raise ValueError(f"Bilinmeyen bozma modeli: {model}")
+        self.model = model
+        self.ber = ber
+        self.p_good_bad = p_good_bad
+        self.p_bad_good = p_bad_good
+        self.ber_good = ber_good
+        self.ber_bad = ber_bad
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.worker = worker
+        self.connections = itertools.count()
+    
+    def settings(self):
+        return (self.model, self.ber, self.p_good_bad, self.p_bad_good, self.ber_good, self.ber_bad, self.seed)
+    
+    def __reduce__(self):
+        return (CorruptionEngine, self.settings() + (self.worker,))
+    
+    def for_worker(self, worker):
+        # İşçi süreçler aynı tohumu paylaşır ama farklı RNG dizileri üretir.
+        return CorruptionEngine(*self.settings(), worker)
+    
+    def describe(self):
+        if self.model == 'ber':
+            return f"BER {self.ber:g} (seed {self.seed})"
+        if self.model == 'gilbert':
+            return (f"Gilbert-Elliott p(i→k) {self.p_good_bad:g}, p(k→i) {self.p_bad_good:g}, "
+                    f"BER iyi {self.ber_good:g} / kötü {self.ber_bad:g} (seed {self.seed})")
+        return f"tek hata (seed {self.seed})"
+    
+    def channel(self):
+        # Her bağlantı kendi RNG'sini alır; aynı seed ve aynı bağlantı sırası
+        # aynı hata dizisini birebir yeniden üretir.
+        return Channel(self, random.Random((self.worker << 64) + self.seed * 1_000_003 + next(self.connections)))
+
+class Channel:
+    def __init__(self, engine, rng):
+        self.engine = engine
+        self.rng = rng
+        self.bad = False
+        self.remaining = geometric(rng, engine.p_good_bad)
+    
+    def apply(self, buffer):
+        # Tüm tampon üzerinde tek geçiş; RNG çağrısı sayısı bit sayısıyla değil
+        # hata ve durum geçişi sayısıyla orantılıdır.
+        engine = self.engine
+        total_bits = len(buffer) * 8
+        if engine.model == 'ber':
+            return flip_bits(buffer, 0, total_bits, engine.ber, self.rng)
+        
+        flipped = 0
+        position = 0
+        while position < total_bits:
+            if self.remaining <= 0:
+                self.bad = not self.bad
+                self.remaining = geometric(self.rng, engine.p_bad_good if self.bad else engine.p_good_bad)
+            span = min(self.remaining, total_bits - position)
+            ber = engine.ber_bad if self.bad else engine.ber_good
+            flipped += flip_bits(buffer, position, position + span, ber, self.rng)
+            position += span
+            self.remaining -= span
+        return flipped
+    
+    def corrupt(self, data, error_method):
+        if self.engine.model == 'single':
+            method_name, method_func = ERROR_METHODS[error_method]
+            log_detail(f"  Uygulanan hata yöntemi: {method_name}")
+            if isinstance(data, str):
+                return method_func(data, self.rng), int(error_method)
+            # İkili yükte bayt düzeyindeki karşılıklar kullanılır; metin sürümü
+            # yazdırılabilir aralığa sıkıştırdığından tek bit çevirmesi birden
+            # çok biti değiştirebilirdi.
+            buffer = bytearray(data)
+            segments = IN_PLACE_ERROR_METHODS[error_method](memoryview(buffer), self.rng)
+            return b''.join(segments), int(error_method)
+        
+        buffer = bytearray(data.encode('utf-8') if isinstance(data, str) else data)
+        flipped = self.apply(buffer)
+        state = " (kanal: kötü)" if self.engine.model == 'gilbert' and self.bad else ""
+        log_detail(f"  Uygulanan hata modeli: {self.engine.describe()} → {flipped} bit çevrildi{state}")
+        if isinstance(data, str):
+            return buffer.decode('utf-8', errors='replace'), CORRUPTION_ERROR_IDS[self.engine.model]
+        return bytes(buffer), CORRUPTION_ERROR_IDS[self.engine.model]
+    
+    def corrupt_in_place(self, payload, error_method):
+        # payload, alınan çerçevenin yük bölgesine bakan yazılabilir bir
+        # memoryview'dır; dönen parçalar yine aynı belleğe bakar.
+        if self.engine.model == 'single':
+            log_detail(f"  Uygulanan hata yöntemi: {ERROR_METHODS[error_method][0]}")
+            return IN_PLACE_ERROR_METHODS[error_method](payload, self.rng), int(error_method)
+        
+        flipped = self.apply(payload)
+        state = " (kanal: kötü)" if self.engine.model == 'gilbert' and self.bad else ""
+        log_detail(f"  Uygulanan hata modeli: {self.engine.describe()} → {flipped} bit çevrildi{state}")
+        return [payload], CORRUPTION_ERROR_IDS[self.engine.model]
+
+def send_buffers(conn, buffers):
+    # Başlık, kontrol ve yük parçaları tek sendmsg çağrısıyla (scatter/gather)
+    # gönderilir; kısmi gönderimde kalan parçalardan devam edilir.
+    if not hasattr(conn, 'sendmsg'):
+        conn.sendall(b''.join(buffers))
+        return
+    
+    pending = [memoryview(buffer) for buffer in buffers if len(buffer)]
+    while pending:
+        sent = conn.sendmsg(pending)
+        while sent:
+            if sent >= len(pending[0]):
+                sent -= len(pending[0])
+                pending.pop(0)
+            else:
+                pending[0] = pending[0][sent:]
+                sent = 0
+
+def close_connection(conn):
+    # Aynı soketi okuyan geri bildirim thread'i shutdown ile uyandırılır;
+    # yalnızca close() bekleyen recv çağrısını sonlandırmaz.
+    try:
+        conn.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    conn.close()
+
+def connection_alive(conn):
+    try:
+        readable, _, _ = select.select([conn], [], [], 0)
+        return not readable or conn.recv(1, socket.MSG_PEEK) != b''
+    except OSError:
+        return False
+
+# Yanıt vermeyen bir Client 2, iletim işçilerini ve kapanışı süresiz bekletmez.
+POOL_SEND_TIMEOUT = 5.0
+STAGE_JOIN_TIMEOUT = 5.0
+# Boru hattında kuyruğu dolan bağlantının okunması durdurulur; kuyruk bu süre
+# içinde boşalmazsa bekleyen paketler meşgul yanıtıyla reddedilir.
+PAUSE_POLL = 0.01
+BUSY_TIMEOUT = 5.0
+# UDP modunda gönderen adres başına kanal tutulur; en uzun süredir sessiz
+# olanlar bu sınırın üstünde atılır.
+UDP_CHANNEL_LIMIT = 1024
+
+class Client2Pool:
+    def __init__(self, host, port, size=4, on_feedback=None):
+        self.host = host
+        self.port = port
+        self.idle = queue.LifoQueue()
+        self.slots = threading.BoundedSemaphore(size)
+        self.on_feedback = on_feedback
+    
+    def connect(self):
+        conn = socket.create_connection((self.host, self.port))
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn.settimeout(POOL_SEND_TIMEOUT)
+        if self.on_feedback is not None:
+            threading.Thread(target=self.read_feedback, args=(conn,), daemon=True).start()
+        return conn
+    
+    def read_feedback(self, conn):
+        # Client 2'nin ARQ geri bildirimleri aynı bağlantının ters yönünden gelir.
+        decoder = FrameDecoder()
+        while True:
+            try:
+                frames, more = decoder.receive(conn)
+            except socket.timeout:
+                continue
+            except (OSError, ValueError):
+                decoder.close()
+                return
+            for frame in frames:
+                self.on_feedback(frame)
+            if not more:
+                return
+    
+    def acquire(self):
+        while True:
+            try:
+                conn = self.idle.get_nowait()
+            except queue.Empty:
+                return self.connect()
+            if connection_alive(conn):
+                return conn
+            close_connection(conn)
+    
+    def send(self, data):
+        transmit = send_buffers if isinstance(data, list) else socket.socket.sendall
+        with self.slots:
+            conn = self.acquire()
+            try:
+                transmit(conn, data)
+            except OSError:
+                close_connection(conn)
+                conn = self.connect()
+                try:
+                    transmit(conn, data)
+                except OSError:
+                    close_connection(conn)
+                    raise
+            self.idle.put(conn)
+    
+    def close(self):
+        while True:
+            try:
+                close_connection(self.idle.get_nowait())
+            except queue.Empty:
+                break
+    
+    def idle_count(self):
+        return self.idle.qsize()
+
+class AsyncClient2Pool:
+    def __init__(self, host, port, size=4, on_feedback=None):
+        self.host = host
+        self.port = port
+        self.idle = []
+        self.slots = asyncio.Semaphore(size)
+        self.on_feedback = on_feedback
+        self.readers = set()
+    
+    async def connect(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.get_extra_info('socket').setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.on_feedback is not None:
+            task = asyncio.create_task(self.read_feedback(reader))
+            self.readers.add(task)
+            task.add_done_callback(self.readers.discard)
+        return reader, writer
+    
+    async def read_feedback(self, reader):
+        decoder = FrameDecoder()
+        while True:
+            try:
+                chunk = await reader.read(65536)
+                frames = decoder.feed(chunk)
+            except (OSError, ValueError):
+                decoder.close()
+                return
+            if not chunk:
+                decoder.close()
+                return
+            for frame in frames:
+                self.on_feedback(frame)
+    
+    async def acquire(self):
+        while self.idle:
+            reader, writer = self.idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        return await self.connect()
+    
+    async def send(self, data):
+        write = asyncio.StreamWriter.writelines if isinstance(data, list) else asyncio.StreamWriter.write
+        async with self.slots:
+            reader, writer = await self.acquire()
+            try:
+                write(writer, data)
+                await writer.drain()
+            except OSError:
+                writer.close()
+                reader, writer = await self.connect()
+                try:
+                    write(writer, data)
+                    await writer.drain()
+                except OSError:
+                    writer.close()
+                    raise
+            self.idle.append((reader, writer))
+    
+    def close(self):
+        while self.idle:
+            _, writer = self.idle.pop()
+            writer.close()
+    
+    def idle_count(self):
+        return len(self.idle)
+
+class PipelineClient:
+    def __init__(self, conn, address, index, channel, on_close, zero_copy=False):
+        self.conn = conn
+        self.address = address
+        self.index = index
+        self.channel = channel
+        self.on_close = on_close
+        self.decoder = FrameDecoder(mutable=zero_copy)
+        self.backlog = deque()
+        self.paused_at = None
+        self.eof = False
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.closing = False
+        self.closed = False
+    
+    def begin(self):
+        with self.lock:
+            self.pending += 1
+    
+    def send(self, data):
+        # Sayaçları değiştirmeden gönderir; ARQ geri bildirimleri için.
+        with self.lock:
+            if not self.closed:
+                try:
+                    self.conn.sendall(data)
+                except OSError:
+                    pass
+    
+    def reply(self, data):
+        # Her paket tam bir yanıt alır; Client 1 yazma yönünü kapatmış olsa da
+        # bağlantı, kuyruktaki paketler yanıtlanana kadar açık kalır.
+        with self.lock:
+            if not self.closed:
+                try:
+                    self.conn.sendall(data)
+                except OSError:
+                    pass
+            self.pending -= 1
+            if self.closing and self.pending == 0:
+                self.close_locked()
+    
+    def finish(self):
+        with self.lock:
+            self.closing = True
+            if self.pending == 0:
+                self.close_locked()
+    
+    def close_locked(self):
+        if not self.closed:
+            self.closed = True
+            self.conn.close()
+            self.on_close(self)
+
 class Server:
-    def __init__(self, host='localhost', port=5000, client2_port=5001):
+    def __init__(self, host='localhost', port=5000, client2_port=5001, mode='thread', backlog=5,
+                 pool_size=4, interactive=True, metrics_port=None, corruption=None, error_method='1',
+                 workers=1, worker=None, queue_size=1024, pipeline_workers=4, zero_copy=False, capture=None,
+                 udp=False, datagram_size=DATAGRAM_SIZE):
         self.host = host
         self.port = port
         self.client2_port = client2_port
-        self.error_method = '1'
+        self.mode = mode
+        self.backlog = backlog
+        self.pool_size = pool_size
+        self.pool = None
+        self.interactive = interactive
+        self.metrics_port = metrics_port
+        self.workers = workers
+        self.worker = worker
+        self.worker_group = None
+        self.queue_size = queue_size
+        self.pipeline_workers = pipeline_workers
+        self.zero_copy = zero_copy
+        self.capture = capture
+        self.capture_log = None
+        self.udp = udp
+        self.datagram_size = datagram_size
+        self.corrupt_queues = []
+        self.forward_queue = None
+        self.ready = threading.Event()
+        
+        self.metrics = Registry()
+        self.packet_counter = self.metrics.counter(
+            'server_packets_total', "Bozulup Client 2'ye iletilen paketler", ('method', 'error'))
+        self.packet_errors = self.metrics.counter(
+            'server_packet_errors_total', "İşlenemeyen (geçersiz) paketler")
+        self.forward_failures = self.metrics.counter(
+            'server_forward_failures_total', "Client 2'ye iletilemeyen paketler")
+        self.relay_seconds = self.metrics.histogram(
+            'server_relay_seconds', "Paket başına çözme, bozma ve iletim süresi", ('method',))
+        self.connections_active = self.metrics.gauge(
+            'server_connections_active', "Açık Client 1 bağlantıları")
+        self.metrics.gauge(
+            'server_pool_idle_connections', "Havuzda boşta bekleyen Client 2 bağlantıları",
+            function=lambda: self.pool.idle_count() if self.pool else 0)
+        self.metrics.gauge(
+            'server_queue_depth', "Boru hattı aşamalarında bekleyen paketler", ('stage',),
+            function=self.queue_depths)
+        self.busy_rejections = self.metrics.counter(
+            'server_busy_rejections_total', "Kuyruk dolu olduğu için reddedilen paketler")
+        self.feedback_counter = self.metrics.counter(
+            'server_feedback_total', "Client 2'den Client 1'e aktarılan ARQ geri bildirimleri", ('kind',))
+        self.feedback_routes = {}
+        self.feedback_lock = threading.Lock()
+        self.error_method = error_method
+        self.corruption = corruption or CorruptionEngine()
+        self.channel = self.corruption.channel()
         self.running = True
         
     def display_menu(self):
+        flush_logs()
         print("\n" + "="*60)
         print("       SERVER - ARA DÜĞÜM + VERİ BOZUCU")
         print("="*60)
@@ -105,73 +601,232 @@ class Server:
         for key, (name, _) in ERROR_METHODS.items():
             marker = " ← seçili" if key == self.error_method else ""
             print(f"  {key}. {name}{marker}")
+        print(f"\nKanal Modeli: {CORRUPTION_MODELS[self.corruption.model]}")
+        print(f"  {self.corruption.describe()}")
         print("-"*60)
         
     def set_error_method(self, method):
         if method in ERROR_METHODS:
             self.error_method = method
+            if self.worker_group is not None:
+                self.worker_group.broadcast(('error_method', method))
             print(f"\n✓ Hata yöntemi değiştirildi: {ERROR_METHODS[method][0]}")
         else:
             print(f"\n✗ Geçersiz yöntem: {method}")
     
-    def corrupt_data(self, data):
-        method_name, method_func = ERROR_METHODS[self.error_method]
-        print(f"  Uygulanan hata yöntemi: {method_name}")
-        return method_func(data)
+    def corrupt_data(self, data, error_method=None, channel=None):
+        return (channel or self.channel).corrupt(data, error_method or self.error_method)
     
     def forward_to_client2(self, packet):
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.connect((self.host, self.client2_port))
-                s.sendall(packet.encode('utf-8'))
-                print(f"  ✓ Paket Client 2'ye iletildi")
-                return True
+            self.pool.send(packet)
+            log_detail(f"  ✓ Paket Client 2'ye iletildi")
+            return True
         except ConnectionRefusedError:
-            print(f"  ✗ Client 2'ye bağlanılamadı (port {self.client2_port})")
+            log_warning(f"  ✗ Client 2'ye bağlanılamadı (port {self.client2_port})")
             return False
         except Exception as e:
-            print(f"  ✗ Client 2'ye iletim hatası: {e}")
+            log_warning(f"  ✗ Client 2'ye iletim hatası: {e}")
             return False
     
-    def handle_client(self, client_socket, address):
+    async def forward_to_client2_async(self, packet):
         try:
-            print(f"\n{'='*60}")
-            print(f"[+] Client 1 bağlandı: {address}")
-            
-            packet = client_socket.recv(4096).decode('utf-8')
-            print(f"  Alınan paket: {packet}")
+            await self.pool.send(packet)
+            log_detail(f"  ✓ Paket Client 2'ye iletildi")
+            return True
+        except ConnectionRefusedError:
+            log_warning(f"  ✗ Client 2'ye bağlanılamadı (port {self.client2_port})")
+            return False
+        except Exception as e:
+            log_warning(f"  ✗ Client 2'ye iletim hatası: {e}")
+            return False
+    
+    def register_route(self, frame, send):
+        # ARQ akışı, geri bildirimlerin döneceği Client 1 bağlantısına eşlenir.
+        if frame_flags(frame) & FLAG_ARQ and len(frame) >= HEADER.size:
+            stream_id = HEADER.unpack_from(frame)[4]
+            with self.feedback_lock:
+                self.feedback_routes[stream_id] = send
+    
+    def drop_routes(self, send):
+        with self.feedback_lock:
+            for stream_id in [key for key, value in self.feedback_routes.items() if value == send]:
+                del self.feedback_routes[stream_id]
+    
+    def route_feedback(self, frame):
+        # Geri bildirim kanalı bozulmaz; ACK/NAK çerçeveleri olduğu gibi aktarılır.
+        try:
+            header, _ = unpack_header(frame)
+        except ValueError as e:
+            log_warning(f"  ✗ Geçersiz geri bildirim: {e}")
+            return
+        
+        send = self.feedback_routes.get(header.stream_id)
+        if send is None:
+            self.feedback_counter.inc('unrouted')
+            return
+        try:
+            send(frame)
+        except OSError:
+            self.feedback_counter.inc('unrouted')
+            return
+        self.feedback_counter.inc('ack' if header.flags & FLAG_ACK else 'nak')
+    
+    def process_packet(self, frame, channel=None):
+        legacy = not is_binary_frame(frame)
+        if self.capture_log is not None:
+            self.capture_log.record(KIND_RECEIVED, [frame, b'\n'] if legacy else [frame])
+        packet = decode_packet(frame)
+        sampled = begin_packet()
+        data, method, control_info = packet[:3]
+        if sampled:
+            log_detail(f"  Alınan paket: {format_packet(packet)}")
+            log_detail(f"  Veri: {describe_data(data)}")
+            log_detail(f"  Yöntem: {method}")
+            log_detail(f"  Kontrol Bilgisi: {control_info}")
+            if packet.flags & FLAG_CHUNK:
+                log_detail(f"  Parça: akış {packet.stream_id:08x} #{packet.seq}")
+            log_detail(f"\n  [Veri Bozma İşlemi]")
+        
+        corrupted_data, error_id = self.corrupt_data(data, self.error_method, channel)
+        if legacy:
+            corrupted_data = corrupted_data.replace('\n', ' ')
+        
+        corrupted_packet = packet._replace(data=corrupted_data, error_id=error_id)
+        if sampled:
+            log_detail(f"  Orijinal veri: {describe_data(data)}")
+            log_detail(f"  Bozulmuş veri: {describe_data(corrupted_data)}")
+            log_detail(f"\n  Bozulmuş paket: {format_packet(corrupted_packet)}")
+        self.packet_counter.inc(method, ERROR_LABELS[error_id])
+        corrupted_frame = encode_packet(*corrupted_packet, legacy=legacy)
+        if self.capture_log is not None:
+            self.capture_log.record(KIND_CORRUPTED, [corrupted_frame], error_id)
+        return corrupted_frame, method
+    
+    def process_packet_in_place(self, frame, channel=None):
+        header, control_end = unpack_header(frame)
+        if self.capture_log is not None:
+            # Çerçeve birazdan yerinde değişeceğinden önce kaydedilir.
+            self.capture_log.record(KIND_RECEIVED, [frame])
+        method = METHOD_NAMES[header.method_id]
+        view = memoryview(frame)
+        sampled = begin_packet()
+        if sampled:
+            control_info = decode_control(view[HEADER.size:control_end], header.digits)
+            log_detail(f"  Alınan paket: <{header.payload_len} bayt>|{method}|{control_info}")
+            if header.flags & FLAG_CHUNK:
+                log_detail(f"  Parça: akış {header.stream_id:08x} #{header.seq}")
+            log_detail(f"\n  [Veri Bozma İşlemi - yerinde]")
+        
+        segments, error_id = (channel or self.channel).corrupt_in_place(view[control_end:], self.error_method)
+        payload_len = sum(len(segment) for segment in segments)
+        HEADER.pack_into(frame, 0, *header._replace(error_id=error_id, payload_len=payload_len))
+        
+        if sampled:
+            log_detail(f"  Bozulmuş paket: <{payload_len} bayt>, {len(segments)} parça halinde iletiliyor")
+        self.packet_counter.inc(method, ERROR_LABELS[error_id])
+        parts = [view[:control_end], *segments]
+        if self.capture_log is not None:
+            self.capture_log.record(KIND_CORRUPTED, parts, error_id)
+        return parts, method
+    
+    def corrupt_frame(self, frame, channel=None):
+        # Sıfır kopya modunda ikili çerçeveler çözülmeden, alındıkları tampon
+        # üzerinde bozulur; eski metin satırları her zamanki yoldan geçer.
+        if self.zero_copy and is_binary_frame(frame):
+            return self.process_packet_in_place(frame, channel)
+        return self.process_packet(frame, channel)
+    
+    def relay_packet(self, frame, channel=None):
+        start = time.perf_counter()
+        try:
+            corrupted_frame, method = self.corrupt_frame(frame, channel)
+            if not self.forward_to_client2(corrupted_frame):
+                self.forward_failures.inc()
+            self.relay_seconds.observe(time.perf_counter() - start, method)
+            return "Paket alındı ve işlendi.\n".encode('utf-8')
+        except ValueError as e:
+            self.packet_errors.inc()
+            log_warning(f"  ✗ Paket işleme hatası: {e}")
+            return f"Hata: {e}\n".encode('utf-8')
+    
+    async def relay_packet_async(self, frame, channel=None):
+        start = time.perf_counter()
+        try:
+            corrupted_frame, method = self.corrupt_frame(frame, channel)
+            if not await self.forward_to_client2_async(corrupted_frame):
+                self.forward_failures.inc()
+            self.relay_seconds.observe(time.perf_counter() - start, method)
+            return "Paket alındı ve işlendi.\n".encode('utf-8')
+        except ValueError as e:
+            self.packet_errors.inc()
+            log_warning(f"  ✗ Paket işleme hatası: {e}")
+            return f"Hata: {e}\n".encode('utf-8')
+    
+    def handle_client(self, client_socket, address, channel):
+        client_socket.settimeout(1.0)
+        decoder = FrameDecoder(mutable=self.zero_copy)
+        send_lock = threading.Lock()
+        
+        def send(data):
+            # Yanıtlar bu thread'den, ARQ geri bildirimleri havuz okuyucularından yazılır.
+            with send_lock:
+                client_socket.sendall(data)
+        
+        self.connections_active.inc()
+        try:
+            log_info(f"\n{'='*60}")
+            log_info(f"[+] Client 1 bağlandı: {address}")
             
-            try:
-                parts = packet.split('|')
-                if len(parts) != 3:
-                    raise ValueError("Geçersiz paket formatı")
-                
-                data, method, control_info = parts
-                print(f"  Veri: {data}")
-                print(f"  Yöntem: {method}")
-                print(f"  Kontrol Bilgisi: {control_info}")
-                
-                print(f"\n  [Veri Bozma İşlemi]")
-                corrupted_data = self.corrupt_data(data)
-                print(f"  Orijinal veri: {data}")
-                print(f"  Bozulmuş veri: {corrupted_data}")
-                
-                corrupted_packet = f"{corrupted_data}|{method}|{control_info}"
-                print(f"\n  Bozulmuş paket: {corrupted_packet}")
+            while self.running:
+                try:
+                    frames, more = decoder.receive(client_socket)
+                except socket.timeout:
+                    continue
                 
-                self.forward_to_client2(corrupted_packet)
+                for frame in frames:
+                    self.register_route(frame, send)
+                    send(self.relay_packet(frame, channel))
+                if not more:
+                    break
                 
-                client_socket.sendall("Paket alındı ve işlendi.".encode('utf-8'))
+        except Exception as e:
+            log_warning(f"  ✗ İstemci işleme hatası: {e}")
+        finally:
+            decoder.close()
+            self.drop_routes(send)
+            self.connections_active.dec()
+            client_socket.close()
+            log_info(f"[-] Client 1 bağlantısı kapatıldı")
+    
+    async def handle_client_async(self, reader, writer):
+        address = writer.get_extra_info('peername')
+        decoder = FrameDecoder(mutable=self.zero_copy)
+        channel = self.corruption.channel()
+        self.connections_active.inc()
+        try:
+            log_info(f"\n{'='*60}")
+            log_info(f"[+] Client 1 bağlandı: {address}")
+            
+            while self.running:
+                chunk = await reader.read(65536)
                 
-            except ValueError as e:
-                print(f"  ✗ Paket işleme hatası: {e}")
-                client_socket.sendall(f"Hata: {e}".encode('utf-8'))
+                frames = decoder.feed(chunk) if chunk else decoder.flush()
+                for frame in frames:
+                    self.register_route(frame, writer.write)
+                    writer.write(await self.relay_packet_async(frame, channel))
+                await writer.drain()
+                if not chunk:
+                    break
                 
         except Exception as e:
-            print(f"  ✗ İstemci işleme hatası: {e}")
+            log_warning(f"  ✗ İstemci işleme hatası: {e}")
         finally:
-            client_socket.close()
-            print(f"[-] Client 1 bağlantısı kapatıldı")
+            decoder.close()
+            self.drop_routes(writer.write)
+            self.connections_active.dec()
+            writer.close()
+            log_info(f"[-] Client 1 bağlantısı kapatıldı")
     
     def input_handler(self):
         while self.running:
@@ -191,20 +846,107 @@ class Server:
                 break
     
     def start(self):
-        self.display_menu()
-        print(f"\nServer başlatılıyor: {self.host}:{self.port}")
+        if self.interactive:
+            self.display_menu()
+        print(f"\nServer başlatılıyor: {self.host}:{self.port} (mod: {'udp' if self.udp else self.mode})")
         print(f"Client 2 port: {self.client2_port}")
-        print("\nKomutlar: '1-6' yöntem seç | 'm' menü | 'q' çıkış")
-        print("-"*60)
+        if self.interactive:
+            print("\nKomutlar: '1-6' yöntem seç | 'm' menü | 'q' çıkış")
+            print("-"*60)
+            
+            input_thread = threading.Thread(target=self.input_handler, daemon=True)
+            input_thread.start()
+        
+        if self.metrics_port is not None:
+            metrics_server = start_metrics_server(self.metrics, self.host, self.metrics_port)
+            print(f"Metrikler: http://{self.host}:{metrics_server.server_address[1]}/metrics")
+        
+        if self.workers > 1:
+            self.start_workers()
+            return
+        
+        if self.capture is not None:
+            path = self.capture if self.worker is None else worker_path(self.capture, self.worker.worker_id)
+            self.capture_log = CaptureWriter(path)
+            if self.worker is None:
+                print(f"Yakalama dosyası: {path}")
+        try:
+            if self.udp:
+                self.start_udp()
+            elif self.mode == 'async':
+                self.start_async()
+            elif self.mode == 'pipeline':
+                self.start_pipeline()
+            else:
+                self.start_threaded()
+        finally:
+            if self.capture_log is not None:
+                self.capture_log.close()
+    
+    def worker_tick(self):
+        # Kabul döngülerinden yaklaşık saniyede bir çağrılır; trafik dursa da
+        # yakalama dosyasının kuyruğu diske iner.
+        if self.capture_log is not None:
+            self.capture_log.flush()
+        if self.worker is None:
+            return
+        for command, value in self.worker.poll():
+            if command == 'error_method':
+                self.error_method = value
+        if self.worker.stopped():
+            self.running = False
+        self.worker.publish(self.metrics, force=not self.running)
+    
+    def start_workers(self):
+        # Pre-fork: işçiler aynı portu SO_REUSEPORT ile dinler, çekirdek gelen
+        # bağlantıları aralarında dağıtır; bu süreç yalnızca istatistik toplar.
+        reserved = reuse_port_socket(self.host, self.port, socket.SOCK_DGRAM if self.udp else socket.SOCK_STREAM)
+        self.port = reserved.getsockname()[1]
+        if self.udp:
+            # Bağlı bir UDP soketi de datagram payı alacağından port hemen bırakılır.
+            reserved.close()
         
-        input_thread = threading.Thread(target=self.input_handler, daemon=True)
-        input_thread.start()
+        self.worker_group = WorkerGroup(self.workers)
+        options = {
+            'host': self.host, 'port': self.port, 'client2_port': self.client2_port, 'mode': self.mode,
+            'backlog': self.backlog, 'pool_size': self.pool_size, 'corruption': self.corruption,
+            'queue_size': self.queue_size, 'pipeline_workers': self.pipeline_workers,
+            'zero_copy': self.zero_copy, 'capture': self.capture, 'udp': self.udp,
+            'datagram_size': self.datagram_size,
+        }
+        self.worker_group.start(run_server_worker, options, self.error_method, logging_settings())
+        self.ready.set()
         
-        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        server_socket.bind((self.host, self.port))
-        server_socket.listen(5)
+        print(f"✓ Server dinlemede: {self.host}:{self.port} ({self.workers} işçi süreç)")
+        
+        try:
+            while self.running and self.worker_group.alive():
+                self.worker_group.collect(self.metrics)
+        except KeyboardInterrupt:
+            print("\n\nServer kapatılıyor (Ctrl+C)...")
+        finally:
+            self.worker_group.stop(self.metrics)
+            reserved.close()
+            flush_logs()
+            print("Server kapatıldı.")
+    
+    def listen_socket(self):
+        if self.worker is not None:
+            server_socket = reuse_port_socket(self.host, self.port)
+        else:
+            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server_socket.bind((self.host, self.port))
+        server_socket.listen(self.backlog)
+        return server_socket
+    
+    def start_threaded(self):
+        self.pool = Client2Pool(self.host, self.client2_port, self.pool_size, self.route_feedback)
+        
+        server_socket = self.listen_socket()
         server_socket.settimeout(1.0)
+        self.port = server_socket.getsockname()[1]
+        self.ready.set()
         
         print(f"✓ Server dinlemede: {self.host}:{self.port}")
         
@@ -212,21 +954,373 @@ class Server:
             while self.running:
                 try:
                     client_socket, address = server_socket.accept()
+                    # Kanal kabul sırasıyla atanır; thread zamanlaması RNG
+                    # dizisini değiştirmez.
                     client_thread = threading.Thread(
                         target=self.handle_client,
-                        args=(client_socket, address)
+                        args=(client_socket, address, self.corruption.channel())
                     )
                     client_thread.start()
                 except socket.timeout:
+                    pass
+                self.worker_tick()
+        except KeyboardInterrupt:
+            print("\n\nServer kapatılıyor (Ctrl+C)...")
+        finally:
+            self.running = False
+            server_socket.close()
+            self.pool.close()
+            self.worker_tick()
+            flush_logs()
+            print("Server kapatıldı.")
+    
+    def relay_datagram(self, frame, channel, forward):
+        start = time.perf_counter()
+        try:
+            corrupted_frame, method = self.corrupt_frame(frame, channel)
+        except ValueError as e:
+            self.packet_errors.inc()
+            log_warning(f"  ✗ Paket işleme hatası: {e}")
+            return
+        try:
+            forward.add(corrupted_frame)
+        except (OSError, ValueError) as e:
+            self.forward_failures.inc()
+            log_warning(f"  ✗ Client 2'ye iletim hatası: {e}")
+        self.relay_seconds.observe(time.perf_counter() - start, method)
+    
+    def start_udp(self):
+        # Bağlantısız mod: her datagramdaki çerçeveler bozulup Client 2'ye yine
+        # toplu datagramlar halinde iletilir; Client 1'e yanıt gönderilmez.
+        # Hata dizisi gönderen adres başına ayrı tutulur.
+        server_socket = udp_socket(self.host, self.port, reuse_port=self.worker is not None)
+        server_socket.setblocking(False)
+        self.port = server_socket.getsockname()[1]
+        forward = DatagramBatcher(udp_socket(), (self.host, self.client2_port), self.datagram_size)
+        channels = OrderedDict()
+        self.ready.set()
+        
+        print(f"✓ Server dinlemede (UDP): {self.host}:{self.port} → Client 2 UDP {self.client2_port}")
+        
+        try:
+            while self.running:
+                for datagram, address in receive_batch(server_socket):
+                    channel = channels.get(address)
+                    if channel is None:
+                        channel = channels[address] = self.corruption.channel()
+                        if len(channels) > UDP_CHANNEL_LIMIT:
+                            channels.popitem(last=False)
+                    else:
+                        channels.move_to_end(address)
+                    try:
+                        frames = split_datagram(datagram, mutable=self.zero_copy)
+                    except ValueError as e:
+                        self.packet_errors.inc()
+                        log_warning(f"  ✗ Datagram işleme hatası: {e}")
+                        continue
+                    for frame in frames:
+                        self.relay_datagram(frame, channel, forward)
+                try:
+                    forward.flush()
+                except OSError as e:
+                    self.forward_failures.inc()
+                    log_warning(f"  ✗ Client 2'ye iletim hatası: {e}")
+                self.worker_tick()
+        except KeyboardInterrupt:
+            print("\n\nServer kapatılıyor (Ctrl+C)...")
+        finally:
+            self.running = False
+            server_socket.close()
+            forward.sock.close()
+            self.worker_tick()
+            flush_logs()
+            print("Server kapatıldı.")
+    
+    def queue_depths(self):
+        if self.forward_queue is None:
+            return {}
+        return {
+            ('corrupt',): sum(q.qsize() for q in self.corrupt_queues),
+            ('forward',): self.forward_queue.qsize(),
+        }
+    
+    def corrupt_worker(self, corrupt_queue):
+        while self.running:
+            try:
+                client, frame, start = corrupt_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            try:
+                corrupted_frame, method = self.corrupt_frame(frame, client.channel)
+            except Exception as e:
+                # İşçi thread'i ölürse bu kuyruğa düşen bağlantılar hiç yanıt
+                # alamaz; her hata paket hatası olarak yanıtlanır.
+                self.packet_errors.inc()
+                log_warning(f"  ✗ Paket işleme hatası: {e}")
+                client.reply(f"Hata: {e}\n".encode('utf-8'))
+                continue
+            # Forward kuyruğu doluysa burada beklenir; bu da corrupt kuyruğunu
+            # doldurup girişte meşgul yanıtına dönüşür. Kapanışta beklemekten vazgeçilir.
+            item = (client, corrupted_frame, method, start, packet_sampled.get())
+            while self.running:
+                try:
+                    self.forward_queue.put(item, timeout=1.0)
+                    break
+                except queue.Full:
                     continue
+    
+    def forward_worker(self):
+        while self.running:
+            try:
+                client, corrupted_frame, method, start, sampled = self.forward_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            begin_packet(sampled)
+            if not self.forward_to_client2(corrupted_frame):
+                self.forward_failures.inc()
+            self.relay_seconds.observe(time.perf_counter() - start, method)
+            client.reply("Paket alındı ve işlendi.\n".encode('utf-8'))
+    
+    def ingest(self, client):
+        # Okunan çerçeveler bağlantının bekleme listesine alınır; bozma kuyruğu
+        # dolarsa False döner ve soket, liste boşalana kadar okunmaz. Böylece
+        # okunmuş paketler reddedilmez, TCP akış denetimi Client 1'i yavaşlatır.
+        try:
+            frames, more = client.decoder.receive(client.conn)
+        except OSError:
+            frames, more = [], False
+        except ValueError as e:
+            log_warning(f"  ✗ İstemci işleme hatası: {e}")
+            frames, more = [], False
+        if not more:
+            client.decoder.close()
+            client.eof = True
+        
+        for frame in frames:
+            self.register_route(frame, client.send)
+            client.begin()
+            client.backlog.append((frame, time.perf_counter()))
+        return self.enqueue(client) and more
+    
+    def enqueue(self, client):
+        # Bağlantının tüm paketleri aynı bozma işçisine gider; sıra ve
+        # bağlantıya özgü RNG dizisi korunur.
+        corrupt_queue = self.corrupt_queues[client.index % len(self.corrupt_queues)]
+        while client.backlog:
+            try:
+                corrupt_queue.put_nowait((client, *client.backlog[0]))
+            except queue.Full:
+                if client.paused_at is None:
+                    client.paused_at = time.monotonic()
+                return False
+            client.backlog.popleft()
+        client.paused_at = None
+        return True
+    
+    def resume(self, client, selector):
+        # Duraklatılan bağlantı için kuyruğu yeniden dener; True dönerse
+        # bağlantı bekleme listesinden çıkar.
+        if not self.enqueue(client):
+            if time.monotonic() - client.paused_at < BUSY_TIMEOUT:
+                return False
+            # Bozma işçisi bu süre boyunca ilerleyemediyse gerçek aşırı yük vardır.
+            while client.backlog:
+                client.backlog.popleft()
+                self.busy_rejections.inc()
+                client.reply("Hata: Server meşgul, paket reddedildi\n".encode('utf-8'))
+            client.paused_at = None
+        if not client.eof:
+            selector.register(client.conn, selectors.EVENT_READ, client)
+        return True
+    
+    def close_pipeline_client(self, client):
+        self.drop_routes(client.send)
+        self.connections_active.dec()
+        log_info(f"[-] Client 1 bağlantısı kapatıldı")
+    
+    def start_pipeline(self):
+        # Sabit sayıda thread: tek giriş (selector) thread'i, bozma işçileri ve
+        # havuz bağlantısı başına bir iletim işçisi; aşamalar sınırlı kuyruklarla
+        # bağlanır.
+        self.pool = Client2Pool(self.host, self.client2_port, self.pool_size, self.route_feedback)
+        self.corrupt_queues = [queue.Queue(self.queue_size) for _ in range(self.pipeline_workers)]
+        self.forward_queue = queue.Queue(self.queue_size)
+        
+        stage_threads = [threading.Thread(target=self.corrupt_worker, args=(q,), daemon=True)
+                         for q in self.corrupt_queues]
+        stage_threads += [threading.Thread(target=self.forward_worker, daemon=True)
+                          for _ in range(self.pool_size)]
+        for thread in stage_threads:
+            thread.start()
+        
+        server_socket = self.listen_socket()
+        self.port = server_socket.getsockname()[1]
+        selector = selectors.DefaultSelector()
+        selector.register(server_socket, selectors.EVENT_READ)
+        connection_index = itertools.count()
+        paused = []
+        self.ready.set()
+        
+        print(f"✓ Server dinlemede: {self.host}:{self.port} "
+              f"({self.pipeline_workers} bozma işçisi, kuyruk {self.queue_size})")
+        
+        try:
+            while self.running:
+                for key, _ in selector.select(timeout=PAUSE_POLL if paused else 1.0):
+                    if key.fileobj is server_socket:
+                        conn, address = server_socket.accept()
+                        conn.setblocking(True)
+                        client = PipelineClient(conn, address, next(connection_index),
+                                                self.corruption.channel(), self.close_pipeline_client,
+                                                self.zero_copy)
+                        selector.register(conn, selectors.EVENT_READ, client)
+                        self.connections_active.inc()
+                        log_info(f"\n{'='*60}")
+                        log_info(f"[+] Client 1 bağlandı: {address}")
+                    elif not self.ingest(key.data):
+                        client = key.data
+                        selector.unregister(key.fileobj)
+                        if client.eof:
+                            client.finish()
+                        if client.backlog:
+                            paused.append(client)
+                paused = [client for client in paused if not self.resume(client, selector)]
+                self.worker_tick()
         except KeyboardInterrupt:
             print("\n\nServer kapatılıyor (Ctrl+C)...")
         finally:
+            self.running = False
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    key.data.finish()
+            for client in paused:
+                client.finish()
+            selector.close()
             server_socket.close()
+            deadline = time.monotonic() + STAGE_JOIN_TIMEOUT
+            for thread in stage_threads:
+                thread.join(max(0.0, deadline - time.monotonic()))
+            self.pool.close()
+            self.worker_tick()
+            flush_logs()
+            print("Server kapatıldı.")
+    
+    async def serve_async(self):
+        self.pool = AsyncClient2Pool(self.host, self.client2_port, self.pool_size, self.route_feedback)
+        
+        server = await asyncio.start_server(
+            self.handle_client_async, self.host, self.port,
+            backlog=self.backlog, reuse_address=True, reuse_port=self.worker is not None
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self.ready.set()
+        
+        print(f"✓ Server dinlemede: {self.host}:{self.port}")
+        
+        try:
+            async with server:
+                while self.running:
+                    await asyncio.sleep(1.0)
+                    self.worker_tick()
+        finally:
+            self.running = False
+            self.pool.close()
+            self.worker_tick()
+    
+    def start_async(self):
+        raise_open_file_limit()
+        try:
+            asyncio.run(self.serve_async())
+        except KeyboardInterrupt:
+            print("\n\nServer kapatılıyor (Ctrl+C)...")
+        finally:
+            flush_logs()
             print("Server kapatıldı.")
 
+def run_server_worker(worker, options, error_method, logging_options):
+    configure_logging(*logging_options)
+    options['corruption'] = options['corruption'].for_worker(worker.worker_id)
+    server = Server(**options, interactive=False, error_method=error_method, worker=worker)
+    try:
+        server.start()
+    except KeyboardInterrupt:
+        pass
+
+def raise_open_file_limit():
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
 def main():
-    server = Server(host='localhost', port=5000, client2_port=5001)
+    parser = argparse.ArgumentParser(description="Server - ara düğüm + veri bozucu")
+    parser.add_argument('--mode', choices=['thread', 'async', 'pipeline'], default='thread',
+                        help="Bağlantı modeli: her bağlantıya bir thread, asyncio veya sınırlı kuyruklu "
+                             "boru hattı (varsayılan: thread)")
+    parser.add_argument('--backlog', type=int, default=5,
+                        help="Dinleme soketi bekleme kuyruğu uzunluğu (varsayılan: 5)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Aynı portu SO_REUSEPORT ile dinleyen işçi süreç sayısı (varsayılan: 1)")
+    parser.add_argument('--error-method', choices=sorted(ERROR_METHODS), default='1',
+                        help="Başlangıçtaki hata enjekte yöntemi (varsayılan: 1, Bit Flip)")
+    parser.add_argument('--zero-copy', action='store_true',
+                        help="İkili çerçeveleri çözmeden, yerinde bozup scatter/gather ile ilet")
+    parser.add_argument('--queue-size', type=int, default=1024,
+                        help="pipeline modunda aşama kuyruklarının kapasitesi (varsayılan: 1024)")
+    parser.add_argument('--pipeline-workers', type=int, default=4,
+                        help="pipeline modunda bozma işçisi sayısı (varsayılan: 4)")
+    parser.add_argument('--udp', action='store_true',
+                        help="Client 1'den UDP datagram al, Client 2'ye UDP ile ilet; yanıt gönderilmez "
+                             "(--mode yok sayılır)")
+    parser.add_argument('--datagram-size', type=int, default=DATAGRAM_SIZE, metavar='BAYT',
+                        help=f"UDP modunda bir datagrama toplanan çerçevelerin azami boyutu "
+                             f"(varsayılan: {DATAGRAM_SIZE})")
+    parser.add_argument('--capture', metavar='DOSYA',
+                        help="Alınan ve bozulan her paketi ikili yakalama dosyasına ekle; replay.py ile "
+                             "yeniden oynatılır (--workers ile işçi başına DOSYA_wN)")
+    parser.add_argument('--pool-size', type=int, default=4,
+                        help="Client 2'ye açık tutulan kalıcı bağlantı sayısı (varsayılan: 4)")
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help="Prometheus biçiminde metrik sunulacak yerel port (varsayılan: kapalı)")
+    parser.add_argument('--corruption', choices=sorted(CORRUPTION_MODELS), default='single',
+                        help="Kanal hata modeli: tek hata, sabit BER veya Gilbert-Elliott (varsayılan: single)")
+    parser.add_argument('--ber', type=float, default=1e-4,
+                        help="'ber' modelinde bit hata oranı (varsayılan: 1e-4)")
+    parser.add_argument('--ge-p-good-bad', type=float, default=1e-4,
+                        help="Gilbert-Elliott: bit başına iyi → kötü geçiş olasılığı (varsayılan: 1e-4)")
+    parser.add_argument('--ge-p-bad-good', type=float, default=1e-2,
+                        help="Gilbert-Elliott: bit başına kötü → iyi geçiş olasılığı (varsayılan: 1e-2)")
+    parser.add_argument('--ge-ber-good', type=float, default=0.0,
+                        help="Gilbert-Elliott: iyi durumda bit hata oranı (varsayılan: 0)")
+    parser.add_argument('--ge-ber-bad', type=float, default=0.1,
+                        help="Gilbert-Elliott: kötü durumda bit hata oranı (varsayılan: 0.1)")
+    parser.add_argument('--seed', type=int,
+                        help="Bozma RNG tohumu; aynı tohum aynı hataları yeniden üretir (varsayılan: rastgele)")
+    add_logging_arguments(parser)
+    args = parser.parse_args()
+    
+    for option in ('ber', 'ge_p_good_bad', 'ge_p_bad_good', 'ge_ber_good', 'ge_ber_bad'):
+        if not 0.0 <= getattr(args, option) <= 1.0:
+            parser.error(f"--{option.replace('_', '-')} 0 ile 1 arasında olmalı")
+    
+    configure_logging(args.verbosity, args.sample)
+    corruption = CorruptionEngine(
+        args.corruption, ber=args.ber, p_good_bad=args.ge_p_good_bad, p_bad_good=args.ge_p_bad_good,
+        ber_good=args.ge_ber_good, ber_bad=args.ge_ber_bad, seed=args.seed
+    )
+    server = Server(host='localhost', port=5000, client2_port=5001,
+                    mode=args.mode, backlog=args.backlog, pool_size=args.pool_size,
+                    metrics_port=args.metrics_port, corruption=corruption,
+                    error_method=args.error_method, workers=args.workers,
+                    queue_size=args.queue_size, pipeline_workers=args.pipeline_workers,
+                    zero_copy=args.zero_copy, capture=args.capture, udp=args.udp,
+                    datagram_size=args.datagram_size)
     server.start()
 
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+import pytest
+
+import client1_sender
+import client2_receiver
+from benchmark_codecs import METHODS, reference_control_info
+
+class RawText(str):
+    # Skaler referanslar str alır: bit tabanlılar ord(c), bayt tabanlılar
+    # encode('utf-8') kullanır. latin-1 ile çözülen ham baytlar her iki yolda da
+    # aynı baytları verir.
+    def encode(self, *args, **kwargs):
+        return super().encode('latin-1')
+
+PAYLOADS = {
+    'empty': '',
+    'ascii': 'Hello, World! 0123456789',
+    'latin1': 'çöü ÇÖÜ ß ÿ é',
+    'above_ff': 'ğışĞİŞ € 日本語 😀',
+    'bytes': bytes(range(256)) + b'\x00\xff\x80\x7f',
+}
+
+def expected_control(payload, method):
+    if isinstance(payload, bytes):
+        payload = RawText(payload.decode('latin-1'))
+    return reference_control_info(payload, method)
+
+@pytest.mark.parametrize('method', METHODS)
+@pytest.mark.parametrize('name', PAYLOADS)
+@pytest.mark.parametrize('module', [client1_sender, client2_receiver], ids=['sender', 'receiver'])
+def test_control_info_matches_reference(module, name, method):
+    payload = PAYLOADS[name]
+    assert module.get_control_info(payload, method) == expected_control(payload, method)
+
+@pytest.mark.skipif(client2_receiver.np is None, reason="numpy kurulu değil")
+@pytest.mark.parametrize('method', METHODS)
+def test_control_info_batch_matches_reference(method):
+    payloads = list(PAYLOADS.values())
+    expected = [expected_control(payload, method) for payload in payloads]
+    assert client2_receiver.get_control_info_batch(payloads, method) == expected
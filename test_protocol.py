@@ -0,0 +1,53 @@
+import socket
+
+import pytest
+
+from protocol import FRAME_VERSION, HEADER, METHOD_IDS, BufferPool, FrameDecoder, decode_packet, encode_packet
+
+def test_tab_led_legacy_line_is_text():
+    decoder = FrameDecoder()
+    frames = decoder.feed(encode_packet('\tgirintili', 'CRC16', 'ABCD', legacy=True))
+    assert frames == [b'\tgirintili|CRC16|ABCD']
+    assert decode_packet(frames[0])[:3] == ('\tgirintili', 'CRC16', 'ABCD')
+
+def test_blank_legacy_lines_are_skipped():
+    decoder = FrameDecoder()
+    data = b'\n\n' + encode_packet('merhaba', 'PARITY', '1', legacy=True) + b'\n'
+    assert decoder.feed(data) == [b'merhaba|PARITY|1']
+    assert decoder.pending() == 0
+
+def test_legacy_and_binary_frames_interleave():
+    decoder = FrameDecoder()
+    binary = encode_packet('ikili', 'CRC16', '1A2B', seq=7)
+    frames = decoder.feed(b'\tsatir|CRC16|0001\n' + binary + b'\n')
+    assert frames == [b'\tsatir|CRC16|0001', binary]
+    assert decode_packet(frames[1]).seq == 7
+
+def test_unknown_version_keeps_earlier_frames():
+    decoder = FrameDecoder()
+    good = encode_packet('sağlam', 'CRC16', '1A2B')
+    frames = decoder.feed(good + b'\x02' + bytes(40))
+    assert frames == [good]
+    assert decoder.pending() == 0
+    with pytest.raises(ValueError, match='sürümü: 2'):
+        decoder.feed(good)
+
+def test_oversized_control_digits_are_rejected():
+    decoder = FrameDecoder()
+    header = HEADER.pack(FRAME_VERSION, METHOD_IDS['CRC16'], 0, 0, 0, 0, 0, 0xFFFFFFFF, 4)
+    assert decoder.feed(header) == []
+    assert decoder.needed == 0
+    with pytest.raises(ValueError, match='Kontrol bilgisi çok uzun'):
+        decoder.feed(b'')
+
+def test_receive_timeout_releases_idle_buffer():
+    pool = BufferPool(size=1024 * 1024)
+    decoder = FrameDecoder(pool=pool)
+    left, right = socket.socketpair()
+    with left, right:
+        right.settimeout(0.01)
+        for _ in range(3):
+            with pytest.raises(socket.timeout):
+                decoder.receive(right)
+            assert decoder.buffer is None
+    assert pool.allocated == 1
@@ -0,0 +1,102 @@
+import multiprocessing
+import queue
+import socket
+import time
+
+def reuse_port_socket(host, port, kind=socket.SOCK_STREAM):
+    if not hasattr(socket, 'SO_REUSEPORT'):
+        raise OSError("Bu platform SO_REUSEPORT desteklemiyor; --workers kullanılamaz")
+    
+    sock = socket.socket(socket.AF_INET, kind)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+class WorkerLink:
+    PUBLISH_INTERVAL = 1.0
+    
+    def __init__(self, worker_id, stats, commands, stop):
+        self.worker_id = worker_id
+        self.stats = stats
+        self.commands = commands
+        self.stop = stop
+        self.last_publish = 0.0
+    
+    def publish(self, registry, force=False):
+        now = time.monotonic()
+        if force or now - self.last_publish >= self.PUBLISH_INTERVAL:
+            self.last_publish = now
+            self.stats.put((self.worker_id, registry.snapshot()))
+    
+    def poll(self):
+        commands = []
+        while True:
+            try:
+                commands.append(self.commands.get_nowait())
+            except queue.Empty:
+                return commands
+    
+    def stopped(self):
+        parent = multiprocessing.parent_process()
+        return self.stop.is_set() or (parent is not None and not parent.is_alive())
+
+class WorkerGroup:
+    def __init__(self, count):
+        # Süreçler temiz başlatılır; fork, üst sürecin thread ve soketlerini
+        # işçilere kopyalar.
+        self.context = multiprocessing.get_context('spawn')
+        self.count = count
+        self.stats = self.context.Queue()
+        self.stop_event = self.context.Event()
+        self.processes = []
+        self.command_queues = []
+        self.snapshots = {}
+    
+    def start(self, target, *args):
+        for worker_id in range(self.count):
+            commands = self.context.Queue()
+            link = WorkerLink(worker_id, self.stats, commands, self.stop_event)
+            process = self.context.Process(target=target, args=(link,) + args,
+                                           name=f"worker-{worker_id}")
+            process.start()
+            self.processes.append(process)
+            self.command_queues.append(commands)
+    
+    def broadcast(self, command):
+        for commands in self.command_queues:
+            commands.put(command)
+    
+    def alive(self):
+        return any(process.is_alive() for process in self.processes)
+    
+    def collect(self, registry, timeout=1.0):
+        try:
+            worker_id, snapshot = self.stats.get(timeout=timeout)
+        except queue.Empty:
+            return False
+        
+        self.snapshots[worker_id] = snapshot
+        while True:
+            try:
+                worker_id, snapshot = self.stats.get_nowait()
+            except queue.Empty:
+                break
+            self.snapshots[worker_id] = snapshot
+        registry.load(self.snapshots.values())
+        return True
+    
+    def stop(self, registry, timeout=5.0):
+        self.stop_event.set()
+        
+        # İşçiler kuyruğa yazdıkları son istatistikler okunmadan çıkamaz;
+        # beklerken kuyruk boşaltılmaya devam edilir.
+        deadline = time.monotonic() + timeout
+        while self.alive() and time.monotonic() < deadline:
+            self.collect(registry, timeout=0.2)
+        self.collect(registry, timeout=0)
+        
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()